@@ -3,14 +3,17 @@ Main game class that manages the game state and loop
 """
 import pygame
 import sys
-import time
+import copy
 import datetime
+from concurrent.futures import ThreadPoolExecutor
 from core.settings import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, TITLE, STATE_MENU, STATE_PLAYING,
+    SCREEN_WIDTH, SCREEN_HEIGHT, FPS, FPS_CAP, TITLE, STATE_MENU, STATE_PLAYING,
     STATE_PAUSED, STATE_GAME_OVER, STATE_LEADERBOARD, STATE_SETTINGS,
-    DEFAULT_SETTINGS, SCORES_FILE, SETTINGS_FILE
+    DEFAULT_SETTINGS, BACKGROUND_MAPS, SCORES_FILE, SETTINGS_FILE,
+    ACTION_START_TRAINING, ACTION_SETTINGS, ACTION_LEADERBOARD, ACTION_QUIT,
+    ACTION_BACK, ACTION_SAVE_EXIT
 )
-from core.utils import load_json, save_json
+from core.utils import load_json, save_json, load_background
 from entities.player import Player
 from entities.target import TargetManager
 from entities.effects import EffectManager
@@ -21,46 +24,74 @@ class Game:
     """
     Main game class
     """
+    # Event types the game actually handles; everything else is blocked at the
+    # SDL level so it never reaches the Python event queue
+    HANDLED_EVENTS = [pygame.QUIT, pygame.KEYDOWN, pygame.MOUSEBUTTONDOWN]
+
     def __init__(self):
         """Initialize the game"""
         # Initialize pygame
         pygame.init()
-        
+
+        # Only allow the events we handle to avoid per-frame dispatch overhead
+        # for events we never look at (mouse motion, joystick, etc.)
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed(self.HANDLED_EVENTS)
+
         # Load settings
         self.settings = load_json("settings.json")
         if not self.settings:
             self.settings = DEFAULT_SETTINGS.copy()
             save_json(self.settings, "settings.json")
         
-        # Get the desktop screen size for proper fullscreen scaling
-        desktop_info = pygame.display.Info()
-        self.desktop_width = desktop_info.current_w
-        self.desktop_height = desktop_info.current_h
-            
         # Set up the display
         self.fullscreen = self.settings["fullscreen"]
         if self.fullscreen:
-            # Use the desktop resolution for fullscreen
-            self.screen = pygame.display.set_mode((self.desktop_width, self.desktop_height), pygame.FULLSCREEN)
-            # Create a scaled surface for rendering at the base resolution
-            self.game_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-            self.scale_factor_x = self.desktop_width / SCREEN_WIDTH
-            self.scale_factor_y = self.desktop_height / SCREEN_HEIGHT
+            # SCALED renders at the base resolution and lets SDL upscale to
+            # the desktop on the GPU, instead of a per-frame software scale
+            self.screen = pygame.display.set_mode(
+                (SCREEN_WIDTH, SCREEN_HEIGHT),
+                pygame.FULLSCREEN | pygame.SCALED | pygame.DOUBLEBUF,
+                vsync=1
+            )
         else:
-            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-            self.game_surface = self.screen
-            self.scale_factor_x = 1.0
-            self.scale_factor_y = 1.0
-            
+            self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), vsync=1)
+
+        # Everything renders at the base resolution in both modes; SCALED
+        # already reports mouse coordinates in the base resolution, so the
+        # screen-to-game mapping is the identity
+        self.game_surface = self.screen
+        self.render_target = self.game_surface
+        self._map_mouse = lambda pos: pos
+
         pygame.display.set_caption(TITLE)
         
+        # Single worker that handles JSON writes off the render thread
+        self._io_executor = ThreadPoolExecutor(max_workers=1)
+
         # Set up the clock
         self.clock = pygame.time.Clock()
         self.fps = FPS
+        # Vsync is only honored with SCALED (fullscreen here); in
+        # windowed mode nothing else paces the loop, and movement is
+        # per-frame, so fall back to the baseline cap to keep game
+        # speed unchanged
+        self._tick_cap = FPS_CAP if self.fullscreen else FPS
+        # FPS shown on the HUD is sampled a few times a second, not every
+        # frame, so its text surface rarely needs re-rendering
+        self._fps_value = 0
+        self._fps_sample_ms = 0
         
         # Game state
         self.state = STATE_MENU
         self.running = True
+        self._prev_dirty = []
+        # State whose static frame is already on screen (pause / game over);
+        # while it matches the current state, draw() skips the redraw
+        self._static_drawn = None
+        # Menu instance that frame belongs to, so switching between menus
+        # inside the same state still forces a redraw
+        self._menu_drawn = None
         self.game_mode = None
         self.difficulty = None
         self.session_time = 60  # seconds
@@ -79,8 +110,6 @@ class Game:
         self.hud = None
         
         # Load menu background
-        from core.settings import BACKGROUND_MAPS
-        from core.utils import load_background
         self.background = load_background(BACKGROUND_MAPS.get("menu", "valorant_menu.jpg"), SCREEN_WIDTH, SCREEN_HEIGHT)
         
         # Create menus
@@ -89,11 +118,46 @@ class Game:
         self.difficulty_menu = None
         self.settings_menu = SettingsMenu(self.settings)
         self.leaderboard_menu = LeaderboardMenu(self.scores)
+        self._leaderboard_dirty = False
+        self._scores_dirty = False
         self.current_menu = self.main_menu
         
         # Hide the mouse cursor but don't lock it to the center
         pygame.mouse.set_visible(False)
-        
+
+        # Per-state dispatch tables: O(1) lookup per frame instead of a
+        # chain of string comparisons in update/draw/handle_events
+        self._update_dispatch = {
+            STATE_MENU: self._update_menu,
+            STATE_PLAYING: self._update_playing,
+            STATE_PAUSED: self._update_static,
+            STATE_GAME_OVER: self._update_static,
+            STATE_SETTINGS: self._update_settings,
+            STATE_LEADERBOARD: self._update_leaderboard,
+        }
+        self._draw_dispatch = {
+            STATE_MENU: self._draw_menu,
+            STATE_PLAYING: self._draw_playing,
+            STATE_PAUSED: self._draw_paused,
+            STATE_GAME_OVER: self._draw_game_over,
+            STATE_SETTINGS: self._draw_settings,
+            STATE_LEADERBOARD: self._draw_leaderboard,
+        }
+        self._click_dispatch = {
+            STATE_PLAYING: self._click_playing,
+            STATE_MENU: self._click_menu,
+            STATE_SETTINGS: self._click_settings,
+            STATE_LEADERBOARD: self._click_leaderboard,
+        }
+        # Main-menu actions are interned constants, so this dict keys on
+        # them directly and the click handler avoids an if/elif chain
+        self._menu_actions = {
+            ACTION_START_TRAINING: self._open_mode_menu,
+            ACTION_SETTINGS: self._open_settings,
+            ACTION_LEADERBOARD: self._open_leaderboard,
+            ACTION_QUIT: self._quit_game,
+        }
+
     def start_game(self, mode, difficulty):
         """
         Start a new game
@@ -116,322 +180,350 @@ class Game:
         self.hud.difficulty = difficulty
         
         # Load the background for this mode
-        from core.settings import BACKGROUND_MAPS
-        from core.utils import load_background
-        
         background_file = BACKGROUND_MAPS.get(mode, "valorant_menu.jpg")
-        if self.fullscreen:
-            self.background = load_background(background_file, SCREEN_WIDTH, SCREEN_HEIGHT)
-        else:
-            self.background = load_background(background_file, SCREEN_WIDTH, SCREEN_HEIGHT)
+        self.background = load_background(background_file, SCREEN_WIDTH, SCREEN_HEIGHT)
         
         # Start countdown
         self.state = STATE_PLAYING
         self.countdown = 3
-        self.countdown_start = time.time()
+        self.countdown_start = pygame.time.get_ticks()
         
-    def update(self):
-        """Update the game state"""
-        # Get mouse position
-        mouse_pos = pygame.mouse.get_pos()
-        
-        # Update based on game state
+    def update(self, mouse_pos):
+        """
+        Update the game state
+
+        Args:
+            mouse_pos (tuple): Mouse position sampled once for this frame,
+                or None in states that ignore the mouse
+        """
+        self._update_dispatch[self.state](mouse_pos)
+
+    def _update_menu(self, mouse_pos):
+        """Update the current menu"""
+        self.current_menu.update(mouse_pos)
+
+    def _update_playing(self, mouse_pos):
+        """Update the countdown or the running game"""
+        # Check if countdown is active
+        current_time = pygame.time.get_ticks()
+        if self.countdown >= 0:
+            if current_time - self.countdown_start > 1000:
+                self.countdown -= 1
+                self.countdown_start = current_time
+
+                # Start the game when countdown reaches -1
+                if self.countdown == -1:
+                    self.start_time = current_time
+        else:
+            # Update game objects, sharing this frame's timestamp so they
+            # don't each call pygame.time.get_ticks() again
+            self.player.update(mouse_pos, current_time)
+            self.target_manager.update(current_time)
+            self.effect_manager.update(current_time)
+
+            # Update time left
+            self.time_left = max(0, self.session_time - (current_time - self.start_time) / 1000)
+
+            # Check if time is up
+            if self.time_left <= 0:
+                self.state = STATE_GAME_OVER
+                self.save_score()
+
+            # Update HUD (FPS resampled every 200 ms)
+            if current_time - self._fps_sample_ms >= 200:
+                self._fps_value = int(self.clock.get_fps())
+                self._fps_sample_ms = current_time
+            self.hud.update(self.player, self.target_manager, self._fps_value, self.time_left)
+
+    def _update_static(self, mouse_pos):
+        """Nothing to update in pause / game over states"""
+        pass
+
+    def _update_settings(self, mouse_pos):
+        """Update the settings menu"""
+        self.settings_menu.update(mouse_pos)
+
+    def _update_leaderboard(self, mouse_pos):
+        """Update the leaderboard menu"""
+        self.leaderboard_menu.update(mouse_pos)
+
+    def _active_menu(self):
+        """Get the menu shown in the current state, or None"""
         if self.state == STATE_MENU:
-            self.current_menu.update(mouse_pos)
-            
-        elif self.state == STATE_PLAYING:
-            # Check if countdown is active
-            current_time = time.time()
-            if self.countdown >= 0:
-                if current_time - self.countdown_start > 1:
-                    self.countdown -= 1
-                    self.countdown_start = current_time
-                    
-                    # Start the game when countdown reaches -1
-                    if self.countdown == -1:
-                        self.start_time = time.time()
-            else:
-                # Update game objects
-                self.player.update()
-                self.target_manager.update()
-                self.effect_manager.update()
-                
-                # Update time left
-                self.time_left = max(0, self.session_time - (time.time() - self.start_time))
-                
-                # Check if time is up
-                if self.time_left <= 0:
-                    self.state = STATE_GAME_OVER
-                    self.save_score()
-                    
-                # Update HUD
-                self.hud.update(self.player, self.target_manager, int(self.clock.get_fps()), self.time_left)
-                
-        elif self.state == STATE_PAUSED:
-            # Nothing to update in pause state
-            pass
-            
-        elif self.state == STATE_GAME_OVER:
-            # Nothing to update in game over state
-            pass
-            
-        elif self.state == STATE_SETTINGS:
-            self.settings_menu.update(mouse_pos)
-            
-        elif self.state == STATE_LEADERBOARD:
-            self.leaderboard_menu.update(mouse_pos)
-            
+            return self.current_menu
+        if self.state == STATE_SETTINGS:
+            return self.settings_menu
+        if self.state == STATE_LEADERBOARD:
+            return self.leaderboard_menu
+        return None
+
     def draw(self):
         """Draw the game"""
-        # Clear the game surface
-        if self.fullscreen:
-            # Draw background
-            self.game_surface.blit(self.background, (0, 0))
+        # Paused and game over screens never change once composed, and
+        # menu screens only change when a hover or click altered them;
+        # skip the whole redraw while the frame on screen is still valid
+        if self._static_drawn == self.state:
+            menu = self._active_menu()
+            if menu is None or (menu is self._menu_drawn
+                                and not menu.dirty):
+                return
+        self._static_drawn = None
+
+        surface = self.render_target
+
+        # Draw background
+        surface.blit(self.background, (0, 0))
+
+        # Draw the current state; each state method returns the dirty
+        # rectangles it touched, or None when the whole frame changed
+        dirty = self._draw_dispatch[self.state](surface)
+
+        # Update the display: push only the regions drawn this frame plus
+        # those from the previous frame (to erase), falling back to a full
+        # flip for states that repaint the whole screen
+        if dirty is None:
+            pygame.display.flip()
+            # The flipped frame covered the whole screen (overlays,
+            # menus); the next dirty-rect frame has to repaint all of
+            # it once or the overlay lingers outside its own rects
+            self._prev_dirty = [surface.get_rect()]
         else:
-            # Draw background
-            self.screen.blit(self.background, (0, 0))
-        
-        # Draw based on game state
-        if self.state == STATE_MENU:
-            if self.fullscreen:
-                self.current_menu.draw(self.game_surface)
-            else:
-                self.current_menu.draw(self.screen)
-            
-        elif self.state == STATE_PLAYING:
-            # Draw game objects
-            if self.fullscreen:
-                self.target_manager.draw(self.game_surface)
-                self.effect_manager.draw(self.game_surface)
-                self.player.draw(self.game_surface)
-                
-                # Draw HUD
-                self.hud.draw(self.game_surface)
-                
-                # Draw countdown if active
-                if self.countdown >= 0:
-                    self.hud.draw_countdown(self.game_surface, self.countdown)
-            else:
-                self.target_manager.draw(self.screen)
-                self.effect_manager.draw(self.screen)
-                self.player.draw(self.screen)
-                
-                # Draw HUD
-                self.hud.draw(self.screen)
-                
-                # Draw countdown if active
-                if self.countdown >= 0:
-                    self.hud.draw_countdown(self.screen, self.countdown)
-                
-        elif self.state == STATE_PAUSED:
-            # Draw game objects (background)
-            if self.fullscreen:
-                self.target_manager.draw(self.game_surface)
-                self.effect_manager.draw(self.game_surface)
-                self.player.draw(self.game_surface)
-                self.hud.draw(self.game_surface)
-                
-                # Draw pause menu
-                self.hud.draw_pause_menu(self.game_surface)
-            else:
-                self.target_manager.draw(self.screen)
-                self.effect_manager.draw(self.screen)
-                self.player.draw(self.screen)
-                self.hud.draw(self.screen)
-                
-                # Draw pause menu
-                self.hud.draw_pause_menu(self.screen)
-            
-        elif self.state == STATE_GAME_OVER:
-            # Draw game objects (background)
-            if self.fullscreen:
-                self.target_manager.draw(self.game_surface)
-                self.effect_manager.draw(self.game_surface)
-                self.player.draw(self.game_surface)
-                
-                # Get high score for current mode and difficulty
-                high_score = self.get_high_score()
-                
-                # Draw game over screen
-                self.hud.draw_game_over(self.game_surface, self.hud.score, high_score)
-            else:
-                self.target_manager.draw(self.screen)
-                self.effect_manager.draw(self.screen)
-                self.player.draw(self.screen)
-                
-                # Get high score for current mode and difficulty
-                high_score = self.get_high_score()
-                
-                # Draw game over screen
-                self.hud.draw_game_over(self.screen, self.hud.score, high_score)
-            
-        elif self.state == STATE_SETTINGS:
-            if self.fullscreen:
-                self.settings_menu.draw(self.game_surface)
-            else:
-                self.settings_menu.draw(self.screen)
-            
-        elif self.state == STATE_LEADERBOARD:
-            if self.fullscreen:
-                self.leaderboard_menu.draw(self.game_surface)
-            else:
-                self.leaderboard_menu.draw(self.screen)
-        
-        # If in fullscreen mode, scale the game surface to the screen
-        if self.fullscreen:
-            # Scale the game surface to fill the screen
-            scaled_surface = pygame.transform.scale(self.game_surface, (self.desktop_width, self.desktop_height))
-            self.screen.blit(scaled_surface, (0, 0))
-            
-        # Update the display
-        pygame.display.flip()
+            pygame.display.update(dirty + self._prev_dirty)
+            self._prev_dirty = [rect.copy() for rect in dirty]
+
+    def _draw_menu(self, surface):
+        """Draw the current menu"""
+        self.current_menu.draw(surface)
+        self.current_menu.dirty = False
+        self._static_drawn = self.state
+        self._menu_drawn = self.current_menu
+        return None
+
+    def _draw_playing(self, surface):
+        """Draw the running game, collecting the regions it touched"""
+        dirty = self.target_manager.draw(surface)
+        dirty += self.effect_manager.draw(surface)
+        dirty += self.player.draw(surface)
+
+        # Draw HUD
+        dirty += self.hud.draw(surface)
+
+        # Draw countdown if active (full-screen overlay, so full update)
+        if self.countdown >= 0:
+            self.hud.draw_countdown(surface, self.countdown)
+            return None
+        return dirty
+
+    def _draw_paused(self, surface):
+        """Draw the frozen game behind the pause menu"""
+        self.target_manager.draw(surface)
+        self.effect_manager.draw(surface)
+        self.player.draw(surface)
+        self.hud.draw(surface)
+
+        # Draw pause menu
+        self.hud.draw_pause_menu(surface)
+        self._static_drawn = STATE_PAUSED
+        return None
+
+    def _draw_game_over(self, surface):
+        """Draw the frozen game behind the game over screen"""
+        self.target_manager.draw(surface)
+        self.effect_manager.draw(surface)
+        self.player.draw(surface)
+
+        # Draw game over screen with the high score for this mode/difficulty
+        self.hud.draw_game_over(surface, self.hud.score, self.get_high_score())
+        self._static_drawn = STATE_GAME_OVER
+        return None
+
+    def _draw_settings(self, surface):
+        """Draw the settings menu"""
+        self.settings_menu.draw(surface)
+        self.settings_menu.dirty = False
+        self._static_drawn = self.state
+        self._menu_drawn = self.settings_menu
+        return None
+
+    def _draw_leaderboard(self, surface):
+        """Draw the leaderboard menu"""
+        self.leaderboard_menu.draw(surface)
+        self.leaderboard_menu.dirty = False
+        self._static_drawn = self.state
+        self._menu_drawn = self.leaderboard_menu
+        return None
         
     def handle_events(self):
         """Handle pygame events"""
-        for event in pygame.event.get():
+        for event in pygame.event.get(self.HANDLED_EVENTS):
             if event.type == pygame.QUIT:
                 self.running = False
-                
+
             elif event.type == pygame.KEYDOWN:
-                if event.key == pygame.K_ESCAPE:
-                    if self.state == STATE_PLAYING and self.countdown < 0:
-                        self.state = STATE_PAUSED
-                    elif self.state == STATE_PAUSED:
-                        self.state = STATE_PLAYING
-                    elif self.state == STATE_MENU and self.current_menu != self.main_menu:
-                        # Go back to previous menu
-                        if self.current_menu == self.mode_menu:
-                            self.current_menu = self.main_menu
-                        elif self.current_menu == self.difficulty_menu:
-                            self.current_menu = self.mode_menu
-                    elif self.state == STATE_SETTINGS:
-                        self.save_settings()
-                        self.state = STATE_MENU
-                        self.current_menu = self.main_menu
-                    elif self.state == STATE_LEADERBOARD:
-                        self.state = STATE_MENU
-                        self.current_menu = self.main_menu
-                        
-                elif event.key == pygame.K_r:
-                    if self.state == STATE_PLAYING:
-                        self.player.reload()
-                    elif self.state == STATE_PAUSED:
-                        # Restart the game
-                        self.start_game(self.game_mode, self.difficulty)
-                        
-                elif event.key == pygame.K_m and self.state == STATE_PAUSED:
-                    # Return to menu
-                    self.state = STATE_MENU
-                    self.current_menu = self.main_menu
-                    
-                elif event.key == pygame.K_q and self.state == STATE_PAUSED:
-                    # Quit the game
-                    self.running = False
-                    
-                elif event.key == pygame.K_SPACE and self.state == STATE_GAME_OVER:
-                    # Return to menu after game over
-                    self.state = STATE_MENU
-                    self.current_menu = self.main_menu
-                    
+                self._handle_keydown(event)
+
             elif event.type == pygame.MOUSEBUTTONDOWN:
                 if event.button == 1:  # Left click
-                    # Convert mouse position if in fullscreen mode
-                    mouse_pos = pygame.mouse.get_pos()
-                    if self.fullscreen:
-                        # Convert from screen coordinates to game coordinates
-                        mouse_pos = (
-                            int(mouse_pos[0] / self.scale_factor_x),
-                            int(mouse_pos[1] / self.scale_factor_y)
-                        )
-                    
-                    if self.state == STATE_PLAYING and self.countdown < 0:
-                        # Shoot
-                        hit_target = self.player.shoot(self.target_manager)
-                        
-                        if hit_target:
-                            # Add hit effect
-                            if hit_target.type == "headshot":
-                                self.effect_manager.add_hit_effect(hit_target.rect.center, (255, 215, 0), hit_target.size)
-                                self.effect_manager.add_text_effect(hit_target.rect.center, "HEADSHOT!", (255, 215, 0), 24)
-                            else:
-                                self.effect_manager.add_hit_effect(hit_target.rect.center, (255, 70, 85), hit_target.size)
-                                
-                            # Add particle effect
-                            self.effect_manager.add_particle_effect(hit_target.rect.center, (255, 255, 255), 3, 15)
-                        else:
-                            # Miss effect at mouse position
-                            self.effect_manager.add_hit_effect(mouse_pos, (150, 150, 150), 10)
-                            
-                    elif self.state == STATE_MENU:
-                        # Handle menu button clicks
-                        action = self.current_menu.handle_event(event)
-                        
-                        if action:
-                            if self.current_menu == self.main_menu:
-                                if action == "Start Training":
-                                    self.current_menu = self.mode_menu
-                                elif action == "Settings":
-                                    self.state = STATE_SETTINGS
-                                elif action == "Leaderboard":
-                                    self.state = STATE_LEADERBOARD
-                                elif action == "Quit":
-                                    self.running = False
-                                    
-                            elif self.current_menu == self.mode_menu:
-                                if action == "Back":
-                                    self.current_menu = self.main_menu
-                                else:
-                                    # Selected a game mode
-                                    self.difficulty_menu = DifficultyMenu(action.lower())
-                                    self.current_menu = self.difficulty_menu
-                                    
-                            elif self.current_menu == self.difficulty_menu:
-                                if action == "Back":
-                                    self.current_menu = self.mode_menu
-                                else:
-                                    # Selected a difficulty
-                                    self.start_game(self.difficulty_menu.selected_mode, action.lower())
-                                    
-                    elif self.state == STATE_SETTINGS:
-                        action = self.settings_menu.handle_event(event)
-                        if action == "Save and Exit":
-                            self.save_settings()
-                            self.state = STATE_MENU
-                            self.current_menu = self.main_menu
-                            
-                    elif self.state == STATE_LEADERBOARD:
-                        action = self.leaderboard_menu.handle_event(event)
-                        if action == "Back":
-                            self.state = STATE_MENU
-                            self.current_menu = self.main_menu
-                            
+                    handler = self._click_dispatch.get(self.state)
+                    if handler:
+                        handler(event)
+
+    def _handle_keydown(self, event):
+        """Handle a KEYDOWN event"""
+        if event.key == pygame.K_ESCAPE:
+            if self.state == STATE_PLAYING and self.countdown < 0:
+                self.state = STATE_PAUSED
+            elif self.state == STATE_PAUSED:
+                self.state = STATE_PLAYING
+            elif self.state == STATE_MENU and self.current_menu != self.main_menu:
+                # Go back to previous menu
+                if self.current_menu == self.mode_menu:
+                    self.current_menu = self.main_menu
+                elif self.current_menu == self.difficulty_menu:
+                    self.current_menu = self.mode_menu
+            elif self.state == STATE_SETTINGS:
+                self.save_settings()
+                self.state = STATE_MENU
+                self.current_menu = self.main_menu
+            elif self.state == STATE_LEADERBOARD:
+                self.state = STATE_MENU
+                self.current_menu = self.main_menu
+
+        elif event.key == pygame.K_r:
+            if self.state == STATE_PLAYING:
+                self.player.reload()
+            elif self.state == STATE_PAUSED:
+                # Restart the game
+                self.start_game(self.game_mode, self.difficulty)
+
+        elif event.key == pygame.K_m and self.state == STATE_PAUSED:
+            # Return to menu
+            self.state = STATE_MENU
+            self.current_menu = self.main_menu
+            self._flush_scores()
+
+        elif event.key == pygame.K_q and self.state == STATE_PAUSED:
+            # Quit the game
+            self.running = False
+
+        elif event.key == pygame.K_SPACE and self.state == STATE_GAME_OVER:
+            # Return to menu after game over
+            self.state = STATE_MENU
+            self.current_menu = self.main_menu
+            self._flush_scores()
+
+    def _click_playing(self, event):
+        """Handle a left click while playing"""
+        if self.countdown >= 0:
+            return
+
+        # The event already carries the click position in game coordinates
+        mouse_pos = self._map_mouse(event.pos)
+
+        # Shoot
+        hit_target = self.player.shoot(self.target_manager, mouse_pos)
+
+        if hit_target:
+            # Add hit effect
+            if hit_target.type == "headshot":
+                self.effect_manager.add_hit_effect(hit_target.rect.center, (255, 215, 0), hit_target.size)
+                self.effect_manager.add_text_effect(hit_target.rect.center, "HEADSHOT!", (255, 215, 0), 24)
+            else:
+                self.effect_manager.add_hit_effect(hit_target.rect.center, (255, 70, 85), hit_target.size)
+
+            # Add particle effect
+            self.effect_manager.add_particle_effect(hit_target.rect.center, (255, 255, 255), 3, 15)
+        else:
+            # Miss effect at mouse position
+            self.effect_manager.add_hit_effect(mouse_pos, (150, 150, 150), 10)
+
+    def _click_menu(self, event):
+        """Handle a left click on the current menu"""
+        action = self.current_menu.handle_event(event)
+        if not action:
+            return
+
+        if self.current_menu == self.main_menu:
+            handler = self._menu_actions.get(action)
+            if handler:
+                handler()
+
+        elif self.current_menu == self.mode_menu:
+            if action == ACTION_BACK:
+                self.current_menu = self.main_menu
+            else:
+                # Selected a game mode
+                self.difficulty_menu = DifficultyMenu(action.lower())
+                self.current_menu = self.difficulty_menu
+
+        elif self.current_menu == self.difficulty_menu:
+            if action == ACTION_BACK:
+                self.current_menu = self.mode_menu
+            else:
+                # Selected a difficulty
+                self.start_game(self.difficulty_menu.selected_mode, action.lower())
+
+    def _open_mode_menu(self):
+        """Switch the main menu to the mode selection menu"""
+        self.current_menu = self.mode_menu
+
+    def _open_settings(self):
+        """Enter the settings screen"""
+        self.state = STATE_SETTINGS
+
+    def _open_leaderboard(self):
+        """Enter the leaderboard screen"""
+        # Rebuild the menu only if scores changed since last view
+        if self._leaderboard_dirty:
+            self.leaderboard_menu = LeaderboardMenu(self.scores)
+            self._leaderboard_dirty = False
+        self.state = STATE_LEADERBOARD
+
+    def _quit_game(self):
+        """Stop the main loop"""
+        self.running = False
+
+    def _click_settings(self, event):
+        """Handle a left click on the settings menu"""
+        action = self.settings_menu.handle_event(event)
+        if action == ACTION_SAVE_EXIT:
+            self.save_settings()
+            self.state = STATE_MENU
+            self.current_menu = self.main_menu
+
+    def _click_leaderboard(self, event):
+        """Handle a left click on the leaderboard menu"""
+        action = self.leaderboard_menu.handle_event(event)
+        if action == ACTION_BACK:
+            self.state = STATE_MENU
+            self.current_menu = self.main_menu
+
     def save_settings(self):
         """Save the current settings to file"""
-        save_json(self.settings, "settings.json")
+        # Write asynchronously; snapshot the dict so later edits can't race
+        # the serializer
+        self._io_executor.submit(save_json, copy.deepcopy(self.settings), "settings.json")
         
         # Apply settings
         if self.settings["fullscreen"] != self.fullscreen:
             self.fullscreen = self.settings["fullscreen"]
-            
-            # Get desktop info for proper fullscreen
-            desktop_info = pygame.display.Info()
-            self.desktop_width = desktop_info.current_w
-            self.desktop_height = desktop_info.current_h
-            
+
             if self.fullscreen:
-                # Switch to fullscreen at desktop resolution
-                self.screen = pygame.display.set_mode((self.desktop_width, self.desktop_height), pygame.FULLSCREEN)
-                # Create a scaled surface for rendering at the base resolution
-                self.game_surface = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT))
-                self.scale_factor_x = self.desktop_width / SCREEN_WIDTH
-                self.scale_factor_y = self.desktop_height / SCREEN_HEIGHT
+                # Switch to hardware-scaled fullscreen at the base resolution
+                self.screen = pygame.display.set_mode(
+                    (SCREEN_WIDTH, SCREEN_HEIGHT),
+                    pygame.FULLSCREEN | pygame.SCALED | pygame.DOUBLEBUF,
+                    vsync=1
+                )
             else:
                 # Switch to windowed mode at base resolution
-                self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT))
-                self.game_surface = self.screen
-                self.scale_factor_x = 1.0
-                self.scale_factor_y = 1.0
-                
+                self.screen = pygame.display.set_mode((SCREEN_WIDTH, SCREEN_HEIGHT), vsync=1)
+
+            self.game_surface = self.screen
+            self.render_target = self.game_surface
+            self._map_mouse = lambda pos: pos
+            self._tick_cap = FPS_CAP if self.fullscreen else FPS
+
     def save_score(self):
         """Save the current score to the leaderboard"""
         if not self.game_mode or not self.difficulty:
@@ -455,20 +547,31 @@ class Game:
         if self.difficulty not in self.scores[self.game_mode]:
             self.scores[self.game_mode][self.difficulty] = []
             
-        self.scores[self.game_mode][self.difficulty].append(score_entry)
+        # The list is already sorted highest-first and holds at most 10
+        # entries, so a linear insertion beats re-sorting or re-heaping
+        scores_list = self.scores[self.game_mode][self.difficulty]
+        for i, entry in enumerate(scores_list):
+            if entry["score"] < score_entry["score"]:
+                scores_list.insert(i, score_entry)
+                break
+        else:
+            scores_list.append(score_entry)
+        del scores_list[10:]
         
-        # Sort scores by value (descending)
-        self.scores[self.game_mode][self.difficulty].sort(key=lambda x: x["score"], reverse=True)
+        # Defer the disk write; _flush_scores runs it on menu return or
+        # shutdown instead of stalling the game-over transition
+        self._scores_dirty = True
         
-        # Keep only top 10 scores
-        if len(self.scores[self.game_mode][self.difficulty]) > 10:
-            self.scores[self.game_mode][self.difficulty] = self.scores[self.game_mode][self.difficulty][:10]
-            
-        # Save to file
-        save_json(self.scores, "scores.json")
-        
-        # Update leaderboard menu
-        self.leaderboard_menu = LeaderboardMenu(self.scores)
+        # Defer the leaderboard menu rebuild until it is next viewed
+        self._leaderboard_dirty = True
+
+    def _flush_scores(self):
+        """Write pending score changes to disk, if any"""
+        if self._scores_dirty:
+            self._scores_dirty = False
+            # Write asynchronously; snapshot so the writer sees a
+            # consistent copy
+            self._io_executor.submit(save_json, copy.deepcopy(self.scores), "scores.json")
         
     def get_high_score(self):
         """
@@ -496,16 +599,27 @@ class Game:
         while self.running:
             # Handle events
             self.handle_events()
-            
+
+            # Sample the mouse once per frame; paused and game-over states
+            # ignore it entirely
+            if self.state in (STATE_PAUSED, STATE_GAME_OVER):
+                mouse_pos = None
+            else:
+                mouse_pos = pygame.mouse.get_pos()
+
             # Update game state
-            self.update()
+            self.update(mouse_pos)
             
             # Draw the game
             self.draw()
             
-            # Cap the frame rate
-            self.clock.tick(self.fps)
+            # Vsync paces the loop when available; tick only acts as a
+            # coarse safety cap for drivers that ignore the vsync request
+            self.clock.tick(self._tick_cap)
             
-        # Clean up
+        # Clean up; write any unsaved scores, then wait for pending
+        # score/settings writes to finish
+        self._flush_scores()
+        self._io_executor.shutdown(wait=True)
         pygame.quit()
         sys.exit()
@@ -0,0 +1,68 @@
+"""
+Optional compiled kernels for the particle and target pools
+
+When numba is installed, the per-frame updates run as single fused loops
+instead of several NumPy passes over the arrays. Without numba the
+callers fall back to their vectorized NumPy paths, so the dependency
+stays optional.
+"""
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+if NUMBA_AVAILABLE:
+    @njit(parallel=True, fastmath=True, cache=True)
+    def update_particles(x, y, vx, vy, size, size0, birth, lifetime,
+                         alive, now, n):
+        """
+        Advance the first n particles one frame, in place
+
+        Writes each particle's liveness into the alive array. Fuses the
+        position, size and age computations into one pass over memory.
+        """
+        for i in prange(n):
+            age = now - birth[i]
+            x[i] += vx[i]
+            y[i] += vy[i]
+            s = size0[i] * (1.0 - age / lifetime[i])
+            size[i] = s if s > 1.0 else 1.0
+            alive[i] = age < lifetime[i]
+
+    @njit(cache=True, fastmath=True)
+    def step_targets(pos, vel, size_arr, spawn_time, lifetime, alive, dead,
+                     now, width, height):
+        """
+        Integrate, bounce and lifetime-check every live target, in place
+
+        Writes expiry into the dead array; slot bookkeeping stays with the
+        caller. Fuses the whole per-frame target step into one loop.
+        """
+        for i in range(pos.shape[0]):
+            if not alive[i]:
+                continue
+            pos[i, 0] += vel[i, 0]
+            pos[i, 1] += vel[i, 1]
+            if pos[i, 0] < 0 or pos[i, 0] + size_arr[i] > width:
+                vel[i, 0] = -vel[i, 0]
+            if pos[i, 1] < 0 or pos[i, 1] + size_arr[i] > height:
+                vel[i, 1] = -vel[i, 1]
+            dead[i] = now - spawn_time[i] >= lifetime[i]
+
+    # Warm up the JITs at import time so the first in-game effect doesn't
+    # pay the compilation stall
+    _z = np.zeros(1, dtype=np.float32)
+    update_particles(_z.copy(), _z.copy(), _z, _z, _z.copy(), _z,
+                     np.zeros(1, dtype=np.int32), np.ones(1, dtype=np.int32),
+                     np.zeros(1, dtype=np.bool_), 0, 1)
+    step_targets(np.zeros((1, 2), dtype=np.float32),
+                 np.zeros((1, 2), dtype=np.float32), _z,
+                 np.zeros(1, dtype=np.int32), np.ones(1, dtype=np.int32),
+                 np.ones(1, dtype=np.bool_), np.zeros(1, dtype=np.bool_),
+                 0, 1, 1)
+else:
+    update_particles = None
+    step_targets = None
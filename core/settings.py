@@ -1,11 +1,15 @@
 """
 Game settings and configuration constants
 """
+import sys
+from collections import namedtuple
+
 
 # Display settings
 SCREEN_WIDTH = 1024
 SCREEN_HEIGHT = 768
 FPS = 120
+FPS_CAP = 240  # software safety cap for when vsync is unavailable
 TITLE = "NeuroShot: Reflex Protocol"
 SCALE_TO_FULLSCREEN = True  # New setting to enable proper fullscreen scaling
 
@@ -47,6 +51,15 @@ GAME_MODE_TRACKING = "tracking"
 GAME_MODE_SWITCH = "switch"
 GAME_MODE_SPIKE = "spike"
 
+# Menu actions, interned so the click handlers compare by pointer before
+# falling back to a character compare
+ACTION_START_TRAINING = sys.intern("Start Training")
+ACTION_SETTINGS = sys.intern("Settings")
+ACTION_LEADERBOARD = sys.intern("Leaderboard")
+ACTION_QUIT = sys.intern("Quit")
+ACTION_BACK = sys.intern("Back")
+ACTION_SAVE_EXIT = sys.intern("Save and Exit")
+
 # Game states
 STATE_MENU = "menu"
 STATE_PLAYING = "playing"
@@ -61,32 +74,18 @@ DIFFICULTY_MEDIUM = "medium"
 DIFFICULTY_HARD = "hard"
 DIFFICULTY_EXTREME = "extreme"
 
-# Difficulty modifiers
+# Difficulty modifiers: immutable namedtuples so lookups on the spawn path
+# are C-level attribute reads instead of nested dict lookups
+DifficultyModifiers = namedtuple(
+    "DifficultyModifiers",
+    ["speed", "size", "lifetime", "spawn_rate"]
+)
+
 DIFFICULTY_MODIFIERS = {
-    DIFFICULTY_EASY: {
-        "target_speed_multiplier": 0.7,
-        "target_size_multiplier": 1.3,
-        "target_lifetime_multiplier": 1.5,
-        "spawn_rate_multiplier": 0.7
-    },
-    DIFFICULTY_MEDIUM: {
-        "target_speed_multiplier": 1.0,
-        "target_size_multiplier": 1.0,
-        "target_lifetime_multiplier": 1.0,
-        "spawn_rate_multiplier": 1.0
-    },
-    DIFFICULTY_HARD: {
-        "target_speed_multiplier": 1.3,
-        "target_size_multiplier": 0.8,
-        "target_lifetime_multiplier": 0.7,
-        "spawn_rate_multiplier": 1.3
-    },
-    DIFFICULTY_EXTREME: {
-        "target_speed_multiplier": 1.7,
-        "target_size_multiplier": 0.6,
-        "target_lifetime_multiplier": 0.5,
-        "spawn_rate_multiplier": 1.7
-    }
+    DIFFICULTY_EASY: DifficultyModifiers(speed=0.7, size=1.3, lifetime=1.5, spawn_rate=0.7),
+    DIFFICULTY_MEDIUM: DifficultyModifiers(speed=1.0, size=1.0, lifetime=1.0, spawn_rate=1.0),
+    DIFFICULTY_HARD: DifficultyModifiers(speed=1.3, size=0.8, lifetime=0.7, spawn_rate=1.3),
+    DIFFICULTY_EXTREME: DifficultyModifiers(speed=1.7, size=0.6, lifetime=0.5, spawn_rate=1.7)
 }
 
 # File paths
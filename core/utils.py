@@ -3,13 +3,42 @@ Utility functions for the game
 """
 import os
 import json
+import functools
+import numpy as np
 import pygame
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from core.settings import IMAGES_DIR, SOUNDS_DIR, FONTS_DIR
 
+@functools.lru_cache(maxsize=128)
+def _load_base_image(filename, convert_alpha):
+    """
+    Load and display-convert an image once, shared across all scales
+
+    Args:
+        filename (str): Image filename
+        convert_alpha (bool): Whether to keep the alpha channel
+
+    Returns:
+        pygame.Surface: The converted base image
+    """
+    path = os.path.join(IMAGES_DIR, filename)
+    image = pygame.image.load(path)
+    return image.convert_alpha() if convert_alpha else image.convert()
+
+@functools.lru_cache(maxsize=256)
 def load_image(filename, scale=1.0, convert_alpha=True):
     """
     Load an image from the images directory
     
+    The decoded base image is cached once per file and shared by every
+    requested scale; scaled variants are cached per (filename, scale,
+    convert_alpha) and stay display-format converted so blits take the
+    fast path. Callers must copy() the surface before mutating it.
+    
     Args:
         filename (str): Image filename
         scale (float): Scale factor for the image
@@ -18,29 +47,27 @@ def load_image(filename, scale=1.0, convert_alpha=True):
     Returns:
         pygame.Surface: The loaded image
     """
-    path = os.path.join(IMAGES_DIR, filename)
     try:
-        if convert_alpha:
-            image = pygame.image.load(path).convert_alpha()
-        else:
-            image = pygame.image.load(path).convert()
-            
+        image = _load_base_image(filename, convert_alpha)
         if scale != 1.0:
             new_size = (int(image.get_width() * scale), int(image.get_height() * scale))
-            image = pygame.transform.scale(image, new_size)
+            image = pygame.transform.smoothscale(image, new_size)
             
         return image
     except pygame.error as e:
-        print(f"Error loading image {path}: {e}")
+        print(f"Error loading image {os.path.join(IMAGES_DIR, filename)}: {e}")
         # Return a placeholder surface
         surf = pygame.Surface((50, 50))
         surf.fill((255, 0, 255))  # Magenta for missing textures
         return surf
 
+@functools.lru_cache(maxsize=64)
 def load_sound(filename):
     """
     Load a sound from the sounds directory
     
+    Cached per filename, so repeated requests reuse the decoded Sound.
+    
     Args:
         filename (str): Sound filename
         
@@ -54,10 +81,13 @@ def load_sound(filename):
         print(f"Error loading sound {path}: {e}")
         return None
 
+@functools.lru_cache(maxsize=32)
 def load_font(filename, size):
     """
     Load a font from the fonts directory
     
+    Cached per (filename, size); Font objects are safely shared.
+    
     Args:
         filename (str): Font filename
         size (int): Font size
@@ -72,6 +102,24 @@ def load_font(filename, size):
         print(f"Error loading font {path}: {e}")
         return pygame.font.SysFont("arial", size)
 
+@functools.lru_cache(maxsize=32)
+def get_sysfont(name, size, bold=False):
+    """
+    Get a system font, loading each (name, size, bold) face only once
+
+    SysFont scans font files on every call, so repeated lookups of the
+    same face are worth caching; Font objects are safely shared.
+
+    Args:
+        name (str): Font family name
+        size (int): Font size
+        bold (bool): Whether to load the bold face
+
+    Returns:
+        pygame.font.Font: The loaded font
+    """
+    return pygame.font.SysFont(name, size, bold=bold)
+
 def load_json(filename):
     """
     Load JSON data from a file
@@ -83,9 +131,13 @@ def load_json(filename):
         dict: The loaded JSON data or empty dict if file doesn't exist
     """
     try:
+        if orjson is not None:
+            # orjson parses straight from bytes, skipping the str decode
+            with open(filename, 'rb') as f:
+                return orjson.loads(f.read())
         with open(filename, 'r') as f:
             return json.load(f)
-    except (FileNotFoundError, json.JSONDecodeError):
+    except (FileNotFoundError, ValueError):
         return {}
 
 def save_json(data, filename):
@@ -97,15 +149,57 @@ def save_json(data, filename):
         filename (str): JSON filename
     """
     try:
-        with open(filename, 'w') as f:
-            json.dump(data, f, indent=4)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(data, f, indent=4)
     except Exception as e:
         print(f"Error saving JSON to {filename}: {e}")
 
+@functools.lru_cache(maxsize=512)
+def _render_text(font, text, color):
+    """
+    Render text through an LRU cache
+
+    Fonts hash by identity, so the key is effectively (font, text, color).
+    HUD strings repeat across frames, which makes re-renders rare.
+
+    Args:
+        font (pygame.font.Font): Font to use
+        text (str): Text to render
+        color (tuple): RGB color tuple
+
+    Returns:
+        pygame.Surface: The rendered text surface
+    """
+    return font.render(text, True, color)
+
+def render_text(text, font, color):
+    """
+    Get a cached rendered surface for the given text
+
+    Same cache as draw_text, for callers that position and blit the
+    surface themselves.
+
+    Args:
+        text (str): Text to render
+        font (pygame.font.Font): Font to use
+        color (tuple): RGB color tuple
+
+    Returns:
+        pygame.Surface: The rendered text surface
+    """
+    return _render_text(font, text, color)
+
 def draw_text(surface, text, font, color, x, y, align="center"):
     """
     Draw text on a surface with alignment options
     
+    Rendered surfaces are cached, so repeating strings (scores, labels,
+    timers) cost a blit rather than a glyph rasterization.
+    
     Args:
         surface (pygame.Surface): Surface to draw on
         text (str): Text to draw
@@ -115,7 +209,7 @@ def draw_text(surface, text, font, color, x, y, align="center"):
         y (int): Y position
         align (str): Text alignment ("left", "center", "right")
     """
-    text_surface = font.render(text, True, color)
+    text_surface = _render_text(font, text, color)
     text_rect = text_surface.get_rect()
     
     if align == "left":
@@ -141,15 +235,56 @@ def format_time(milliseconds):
     minutes = int(seconds // 60)
     seconds = seconds % 60
     return f"{minutes:02d}:{seconds:05.2f}"
+@functools.lru_cache(maxsize=4)
+def _placeholder_background(width, height):
+    """
+    Build the gradient-with-grid placeholder background
+
+    Cached per (width, height), so every missing or unreadable background
+    file at the same resolution shares one surface. Callers must not
+    mutate the returned surface.
+
+    The gradient and grid lines are written through surfarray in a few
+    NumPy broadcasts instead of one draw.line call per row.
+
+    Args:
+        width (int): Surface width
+        height (int): Surface height
+
+    Returns:
+        pygame.Surface: The placeholder surface, display-format converted
+    """
+    surface = pygame.Surface((width, height))
+    arr = pygame.surfarray.pixels3d(surface)  # shape (w, h, 3)
+
+    # Gradient from dark blue to dark purple down the screen
+    ys = np.arange(height, dtype=np.float32)
+    arr[:, :, 0] = 20
+    arr[:, :, 1] = 20
+    arr[:, :, 2] = (40 + ys / height * 40).astype(np.uint8)[None, :]
+
+    # Grid lines for depth
+    grid_spacing = 50
+    arr[::grid_spacing, :, :] = (60, 60, 100)
+    arr[:, ::grid_spacing, :] = (60, 60, 100)
+
+    del arr  # release the surface lock before converting
+    return surface.convert()
+
+@functools.lru_cache(maxsize=8)
 def load_background(filename, width, height):
     """
     Load a background image and scale it to the specified dimensions
-    
+
+    Results are cached per (filename, width, height), so re-entering a mode
+    reuses the already decoded and scaled surface. Callers must not mutate
+    the returned surface.
+
     Args:
         filename (str): Background image filename
         width (int): Target width
         height (int): Target height
-        
+
     Returns:
         pygame.Surface: The loaded and scaled background image
     """
@@ -159,31 +294,12 @@ def load_background(filename, width, height):
     try:
         # Create a placeholder if the file doesn't exist
         if not os.path.exists(path):
-            # Create a gradient background as a placeholder
-            surface = pygame.Surface((width, height))
-            for y in range(height):
-                # Create a gradient from dark blue to dark purple
-                color = (20, 20, 40 + int(y / height * 40))
-                pygame.draw.line(surface, color, (0, y), (width, y))
-                
-            # Add some grid lines for depth
-            grid_spacing = 50
-            grid_color = (60, 60, 100, 30)
-            for x in range(0, width, grid_spacing):
-                pygame.draw.line(surface, grid_color, (x, 0), (x, height), 1)
-            for y in range(0, height, grid_spacing):
-                pygame.draw.line(surface, grid_color, (0, y), (width, y), 1)
-                
-            return surface
-            
-        # Load and scale the image
-        image = pygame.image.load(path)
+            return _placeholder_background(width, height)
+
+        # Load and scale the image; convert to the display format so blits
+        # take SDL's fast same-format path instead of converting per blit
+        image = pygame.image.load(path).convert()
         return pygame.transform.scale(image, (width, height))
     except pygame.error as e:
         print(f"Error loading background {path}: {e}")
-        # Return a placeholder surface with a gradient
-        surface = pygame.Surface((width, height))
-        for y in range(height):
-            color = (20, 20, 40 + int(y / height * 40))
-            pygame.draw.line(surface, color, (0, y), (width, y))
-        return surface
+        return _placeholder_background(width, height)
@@ -1,18 +1,97 @@
 """
 Visual effects for the game
 """
+import functools
 import random
 import pygame
-import math
+import numpy as np
+from core.particle_kernels import update_particles as _update_particles_njit
 
-class Particle:
+@functools.lru_cache(maxsize=16)
+def _text_effect_font(size):
+    """Shared bold font for text effects; SysFont construction is slow"""
+    return pygame.font.SysFont("arial", size, bold=True)
+
+# Number of pre-faded frames a TextEffect renders up front
+TEXT_EFFECT_FRAMES = 16
+
+# Number of size/alpha steps in the pre-rendered particle and ring sprites
+PARTICLE_FRAMES = 16
+RING_FRAMES = 20
+
+# Precomputed unit direction vectors; picking a random index replaces a
+# math.cos/math.sin pair per spawned particle
+_UNIT_COUNT = 4096
+_UNIT_ANGLES = np.linspace(0, 2 * np.pi, _UNIT_COUNT, endpoint=False)
+_UNIT_X = np.cos(_UNIT_ANGLES).astype(np.float32)
+_UNIT_Y = np.sin(_UNIT_ANGLES).astype(np.float32)
+
+@functools.lru_cache(maxsize=32)
+def _particle_sprites(color, base_size):
+    """
+    Pre-rendered shrinking/fading circle sprites for one (color, size) combo
+
+    Frame i covers ages in [i/N, (i+1)/N) of the particle's lifetime.
+    """
+    frames = []
+    for i in range(PARTICLE_FRAMES):
+        frac = i / PARTICLE_FRAMES
+        radius = max(1, int(base_size * (1 - frac)))
+        alpha = int(255 * (1 - frac))
+        sprite = pygame.Surface((radius * 2, radius * 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, color + (alpha,), (radius, radius), radius)
+        frames.append(sprite)
+    return frames
+
+@functools.lru_cache(maxsize=32)
+def _ring_sprites(color, max_size):
+    """
+    Pre-rendered expanding rings for one (color, max_size) hit effect
+
+    Frame i holds the ring at size (i+1)/N of max_size, with matching alpha.
     """
-    Simple particle effect
+    frames = []
+    for i in range(RING_FRAMES):
+        frac = (i + 1) / RING_FRAMES
+        radius = max(1, int(max_size * frac))
+        alpha = int(255 * frac)
+        sprite = pygame.Surface((radius * 2 + 2, radius * 2 + 2), pygame.SRCALPHA)
+        pygame.draw.circle(sprite, color + (alpha,),
+                           (radius + 1, radius + 1), radius, 2)
+        frames.append(sprite)
+    return frames
+
+class ParticlePool:
     """
-    def __init__(self, x, y, color, size, speed, lifetime):
+    Struct-of-arrays pool for the spark particles
+
+    Positions, velocities, sizes and ages live in parallel NumPy arrays so
+    the per-frame update is a handful of vectorized operations instead of a
+    Python loop over particle objects.
+    """
+    def __init__(self, capacity=512):
         """
-        Initialize a particle
-        
+        Initialize the pool
+
+        Args:
+            capacity (int): Maximum number of live particles
+        """
+        self.capacity = capacity
+        self.count = 0
+        self.x = np.zeros(capacity, dtype=np.float32)
+        self.y = np.zeros(capacity, dtype=np.float32)
+        self.vx = np.zeros(capacity, dtype=np.float32)
+        self.vy = np.zeros(capacity, dtype=np.float32)
+        self.size0 = np.zeros(capacity, dtype=np.float32)
+        self.size = np.zeros(capacity, dtype=np.float32)
+        self.birth = np.zeros(capacity, dtype=np.int32)
+        self.lifetime = np.ones(capacity, dtype=np.int32)
+        self.color = np.zeros((capacity, 3), dtype=np.uint8)
+
+    def add(self, x, y, color, size, speed, lifetime, now):
+        """
+        Add one particle with a random direction
+
         Args:
             x (int): X position
             y (int): Y position
@@ -20,53 +99,152 @@ class Particle:
             size (int): Particle size
             speed (float): Movement speed
             lifetime (int): Lifetime in milliseconds
+            now (int): Current timestamp from pygame.time.get_ticks()
         """
-        self.x = x
-        self.y = y
-        self.color = color
-        self.size = size
-        self.lifetime = lifetime
-        self.birth_time = pygame.time.get_ticks()
-        self.age = 0
-        
-        # Random direction
-        angle = random.uniform(0, 2 * math.pi)
-        self.vx = math.cos(angle) * speed
-        self.vy = math.sin(angle) * speed
-        
-    def update(self):
-        """Update the particle"""
-        # Update position
-        self.x += self.vx
-        self.y += self.vy
-        
-        # Update age
-        self.age = pygame.time.get_ticks() - self.birth_time
-        
-        # Shrink as it ages
-        self.size = max(1, self.size * (1 - self.age / self.lifetime))
-        
-        # Check if it's dead
-        return self.age >= self.lifetime
-        
+        if self.count >= self.capacity:
+            return
+        i = self.count
+        k = random.randrange(_UNIT_COUNT)
+        self.x[i] = x
+        self.y[i] = y
+        self.vx[i] = _UNIT_X[k] * speed
+        self.vy[i] = _UNIT_Y[k] * speed
+        self.size0[i] = size
+        self.size[i] = size
+        self.birth[i] = now
+        self.lifetime[i] = lifetime
+        self.color[i] = color
+        self.count = i + 1
+
+    def emit(self, x, y, color, size, count, now):
+        """
+        Add a burst of particles with random directions, speeds and lifetimes
+
+        All per-particle randoms are generated in bulk NumPy calls and
+        written into the arrays as slices, instead of one Python round-trip
+        per particle.
+
+        Args:
+            x (int): X position
+            y (int): Y position
+            color (tuple): RGB color tuple
+            size (int): Particle size
+            count (int): Number of particles to add
+            now (int): Current timestamp from pygame.time.get_ticks()
+        """
+        i0 = self.count
+        i1 = min(i0 + count, self.capacity)
+        n = i1 - i0
+        if n <= 0:
+            return
+
+        angles = np.random.uniform(0, 2 * np.pi, n).astype(np.float32)
+        speeds = np.random.uniform(1.0, 3.0, n).astype(np.float32)
+        self.x[i0:i1] = x
+        self.y[i0:i1] = y
+        self.vx[i0:i1] = np.cos(angles) * speeds
+        self.vy[i0:i1] = np.sin(angles) * speeds
+        self.size0[i0:i1] = size
+        self.size[i0:i1] = size
+        self.birth[i0:i1] = now
+        self.lifetime[i0:i1] = np.random.randint(300, 800, n)
+        self.color[i0:i1] = color
+        self.count = i1
+
+    def update(self, now):
+        """
+        Advance all particles one frame and drop the expired ones
+
+        Args:
+            now (int): Current frame timestamp from pygame.time.get_ticks()
+        """
+        n = self.count
+        if n == 0:
+            return
+
+        if _update_particles_njit is not None:
+            # Fused compiled kernel: one pass over the arrays
+            alive = np.empty(n, dtype=np.bool_)
+            _update_particles_njit(self.x[:n], self.y[:n],
+                                   self.vx[:n], self.vy[:n],
+                                   self.size[:n], self.size0[:n],
+                                   self.birth[:n], self.lifetime[:n],
+                                   alive, now, n)
+        else:
+            age = now - self.birth[:n]
+            frac = age / self.lifetime[:n]
+
+            self.x[:n] += self.vx[:n]
+            self.y[:n] += self.vy[:n]
+            # Shrink as they age, like the old per-particle update did
+            self.size[:n] = np.maximum(1.0, self.size0[:n] * (1.0 - frac))
+
+            alive = age < self.lifetime[:n]
+        m = int(np.count_nonzero(alive))
+        if m < n:
+            # Compact the live particles to the front of every array
+            for arr in (self.x, self.y, self.vx, self.vy,
+                        self.size0, self.size, self.birth, self.lifetime,
+                        self.color):
+                arr[:m] = arr[:n][alive]
+            self.count = m
+
     def draw(self, surface):
         """
-        Draw the particle
-        
+        Draw the live particles
+
         Args:
-            surface (pygame.Surface): Surface to draw on
+            surface (pygame.Surface): Surface to draw on (SRCALPHA)
         """
-        # Calculate alpha based on age
-        alpha = 255 * (1 - self.age / self.lifetime)
-        
-        # Draw the particle
-        pygame.draw.circle(surface, self.color + (alpha,), (int(self.x), int(self.y)), int(self.size))
+        n = self.count
+        if n == 0:
+            return
+        now = pygame.time.get_ticks()
+        frac = (now - self.birth[:n]) / self.lifetime[:n]
+        buckets = np.clip((frac * PARTICLE_FRAMES).astype(int),
+                          0, PARTICLE_FRAMES - 1)
+        xs = self.x[:n].astype(int)
+        ys = self.y[:n].astype(int)
+        colors = self.color[:n]
+        # Look up the pre-rendered sprite for each particle's age bucket
+        # and push them all in one C-level blit loop
+        blits = []
+        for i in range(n):
+            r, g, b = colors[i]
+            sprite = _particle_sprites((int(r), int(g), int(b)),
+                                       int(self.size0[i]))[buckets[i]]
+            half = sprite.get_width() // 2
+            blits.append((sprite, (xs[i] - half, ys[i] - half)))
+        surface.blits(blits)
+
+    def clear(self):
+        """Remove all particles"""
+        self.count = 0
 
 
 class HitEffect:
     """
     Effect shown when a target is hit
     """
+    # Free-list of dead instances for reuse, bounded to avoid hoarding
+    _pool = []
+    _POOL_MAX = 256
+
+    @classmethod
+    def create(cls, *args):
+        """Get a recycled instance if one is available, else a new one"""
+        if cls._pool:
+            effect = cls._pool.pop()
+            effect.__init__(*args)
+            return effect
+        return cls(*args)
+
+    @classmethod
+    def recycle(cls, effect):
+        """Return a dead instance to the free-list"""
+        if len(cls._pool) < cls._POOL_MAX:
+            cls._pool.append(effect)
+
     def __init__(self, x, y, color, size):
         """
         Initialize a hit effect
@@ -87,9 +265,15 @@ class HitEffect:
         self.growing = True
         self.lifetime = 300  # milliseconds
         self.birth_time = pygame.time.get_ticks()
+        self._sprites = _ring_sprites(color, size)
         
-    def update(self):
-        """Update the hit effect"""
+    def update(self, now):
+        """
+        Update the hit effect
+
+        Args:
+            now (int): Current frame timestamp from pygame.time.get_ticks()
+        """
         if self.growing:
             self.size += self.growth_rate
             if self.size >= self.max_size:
@@ -99,8 +283,7 @@ class HitEffect:
             self.size -= self.shrink_rate
             
         # Check if it's dead
-        age = pygame.time.get_ticks() - self.birth_time
-        return self.size <= 0 or age >= self.lifetime
+        return self.size <= 0 or now - self.birth_time >= self.lifetime
         
     def draw(self, surface):
         """
@@ -109,17 +292,49 @@ class HitEffect:
         Args:
             surface (pygame.Surface): Surface to draw on
         """
-        # Calculate alpha based on size
-        alpha = 255 * (self.size / self.max_size)
-        
-        # Draw the effect as a circle
-        pygame.draw.circle(surface, self.color + (alpha,), (int(self.x), int(self.y)), int(self.size), 2)
+        # Blit the pre-rendered ring for the current size bucket; its alpha
+        # already matches size / max_size
+        entry = self.blit_entry()
+        if entry:
+            surface.blit(*entry)
+
+    def blit_entry(self):
+        """
+        Get this effect's (sprite, rect) pair for a batched blits() call
+
+        Returns:
+            tuple or None: (sprite, rect), or None while invisible
+        """
+        if self.size <= 0:
+            return None
+        idx = min(RING_FRAMES - 1, int(self.size / self.max_size * RING_FRAMES))
+        sprite = self._sprites[idx]
+        return (sprite, sprite.get_rect(center=(int(self.x), int(self.y))))
         
 
 class TextEffect:
     """
     Floating text effect
     """
+    # Free-list of dead instances for reuse, bounded to avoid hoarding
+    _pool = []
+    _POOL_MAX = 256
+
+    @classmethod
+    def create(cls, *args):
+        """Get a recycled instance if one is available, else a new one"""
+        if cls._pool:
+            effect = cls._pool.pop()
+            effect.__init__(*args)
+            return effect
+        return cls(*args)
+
+    @classmethod
+    def recycle(cls, effect):
+        """Return a dead instance to the free-list"""
+        if len(cls._pool) < cls._POOL_MAX:
+            cls._pool.append(effect)
+
     def __init__(self, x, y, text, color, size, lifetime=1000):
         """
         Initialize a text effect
@@ -142,19 +357,30 @@ class TextEffect:
         self.age = 0
         self.vy = -1  # Float upward
         
-        # Create the font and render the text
-        self.font = pygame.font.SysFont("arial", size, bold=True)
+        # Render the text once, then precompute the faded frames so draw
+        # never has to copy the surface and reset its alpha per frame
+        self.font = _text_effect_font(size)
         self.text_surface = self.font.render(text, True, color)
         self.text_rect = self.text_surface.get_rect(center=(x, y))
+        self._frames = []
+        for i in range(TEXT_EFFECT_FRAMES):
+            frame = self.text_surface.copy()
+            frame.set_alpha(int(255 * (1 - i / TEXT_EFFECT_FRAMES)))
+            self._frames.append(frame)
         
-    def update(self):
-        """Update the text effect"""
+    def update(self, now):
+        """
+        Update the text effect
+
+        Args:
+            now (int): Current frame timestamp from pygame.time.get_ticks()
+        """
         # Update position
         self.y += self.vy
         self.text_rect.center = (self.x, self.y)
         
         # Update age
-        self.age = pygame.time.get_ticks() - self.birth_time
+        self.age = now - self.birth_time
         
         # Check if it's dead
         return self.age >= self.lifetime
@@ -166,15 +392,10 @@ class TextEffect:
         Args:
             surface (pygame.Surface): Surface to draw on
         """
-        # Calculate alpha based on age
-        alpha = 255 * (1 - self.age / self.lifetime)
-        
-        # Create a copy of the text surface with the new alpha
-        text_surface_alpha = self.text_surface.copy()
-        text_surface_alpha.set_alpha(alpha)
-        
-        # Draw the text
-        surface.blit(text_surface_alpha, self.text_rect)
+        # Pick the pre-faded frame for the current age bucket
+        idx = min(TEXT_EFFECT_FRAMES - 1,
+                  int(self.age / self.lifetime * TEXT_EFFECT_FRAMES))
+        surface.blit(self._frames[idx], self.text_rect)
 
 
 class EffectManager:
@@ -183,20 +404,51 @@ class EffectManager:
     """
     def __init__(self):
         """Initialize the effect manager"""
-        self.particles = []
+        self.particles = ParticlePool()
         self.hit_effects = []
         self.text_effects = []
+        # Reused scratch surface for alpha blending; allocated lazily and
+        # cleared per frame instead of reallocating a full-screen surface
+        self._alpha_surface = None
         
-    def update(self):
-        """Update all effects"""
-        # Update particles and remove dead ones
-        self.particles = [p for p in self.particles if not p.update()]
-        
-        # Update hit effects and remove dead ones
-        self.hit_effects = [e for e in self.hit_effects if not e.update()]
+    @staticmethod
+    def _prune(effects, now):
+        """
+        Update a list of effects, removing dead ones in place
+
+        Dead entries are overwritten by swapping the last live entry into
+        their slot, so no new list is allocated per frame. Order is not
+        preserved, which these effects don't rely on.
+
+        Args:
+            effects (list): Effects whose update(now) returns True when dead
+            now (int): Current frame timestamp from pygame.time.get_ticks()
+        """
+        i = 0
+        n = len(effects)
+        while i < n:
+            effect = effects[i]
+            if effect.update(now):
+                n -= 1
+                effects[i] = effects[n]
+                effect.recycle(effect)
+            else:
+                i += 1
+        del effects[n:]
+
+    def update(self, now):
+        """
+        Update all effects
+
+        Args:
+            now (int): Current frame timestamp from pygame.time.get_ticks()
+        """
+        # Update the particle pool (vectorized, drops dead particles)
+        self.particles.update(now)
         
-        # Update text effects and remove dead ones
-        self.text_effects = [t for t in self.text_effects if not t.update()]
+        # Update hit and text effects, pruning dead ones in place
+        self._prune(self.hit_effects, now)
+        self._prune(self.text_effects, now)
         
     def draw(self, surface):
         """
@@ -205,24 +457,55 @@ class EffectManager:
         Args:
             surface (pygame.Surface): Surface to draw on
         """
-        # Create a surface for alpha blending
-        alpha_surface = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
+        # Reuse the alpha-blending surface across frames; a fill is a
+        # memset, far cheaper than a fresh full-screen allocation
+        size = surface.get_size()
+        if self._alpha_surface is None or self._alpha_surface.get_size() != size:
+            self._alpha_surface = pygame.Surface(size, pygame.SRCALPHA)
+        alpha_surface = self._alpha_surface
+        alpha_surface.fill((0, 0, 0, 0))
         
         # Draw particles
-        for particle in self.particles:
-            particle.draw(alpha_surface)
+        self.particles.draw(alpha_surface)
             
-        # Draw hit effects
-        for effect in self.hit_effects:
-            effect.draw(alpha_surface)
-            
-        # Draw text effects
-        for text in self.text_effects:
-            text.draw(alpha_surface)
+        # Draw hit effects in one batched blit call
+        if self.hit_effects:
+            entries = [entry for entry in
+                       (effect.blit_entry() for effect in self.hit_effects)
+                       if entry]
+            alpha_surface.blits(entries, doreturn=0)
             
         # Blit the alpha surface onto the main surface
         surface.blit(alpha_surface, (0, 0))
-        
+            
+        # Text effects carry their own per-surface alpha, so they can skip
+        # the intermediate and blit straight to the target
+        for text in self.text_effects:
+            text.draw(surface)
+
+        return self.get_dirty_rects()
+
+    def get_dirty_rects(self):
+        """
+        Get the rectangles covered by the live effects
+
+        Returns:
+            list: Bounding rectangles, for dirty-rect updates
+        """
+        rects = []
+        pool = self.particles
+        for i in range(pool.count):
+            size = int(pool.size[i]) + 1
+            rects.append(pygame.Rect(int(pool.x[i]) - size, int(pool.y[i]) - size,
+                                     size * 2, size * 2))
+        for effect in self.hit_effects:
+            size = int(effect.size) + 2
+            rects.append(pygame.Rect(int(effect.x) - size, int(effect.y) - size,
+                                     size * 2, size * 2))
+        for text in self.text_effects:
+            rects.append(text.text_rect)
+        return rects
+
     def add_particle_effect(self, pos, color, size, count):
         """
         Add a particle effect at the given position
@@ -233,10 +516,8 @@ class EffectManager:
             size (int): Particle size
             count (int): Number of particles to create
         """
-        for _ in range(count):
-            speed = random.uniform(1, 3)
-            lifetime = random.randint(300, 800)
-            self.particles.append(Particle(pos[0], pos[1], color, size, speed, lifetime))
+        self.particles.emit(pos[0], pos[1], color, size, count,
+                            pygame.time.get_ticks())
             
     def add_hit_effect(self, pos, color, size):
         """
@@ -247,7 +528,7 @@ class EffectManager:
             color (tuple): RGB color tuple
             size (int): Effect size
         """
-        self.hit_effects.append(HitEffect(pos[0], pos[1], color, size))
+        self.hit_effects.append(HitEffect.create(pos[0], pos[1], color, size))
         
     def add_text_effect(self, pos, text, color, size):
         """
@@ -259,7 +540,7 @@ class EffectManager:
             color (tuple): RGB color tuple
             size (int): Font size
         """
-        self.text_effects.append(TextEffect(pos[0], pos[1], text, color, size))
+        self.text_effects.append(TextEffect.create(pos[0], pos[1], text, color, size))
         
     def clear(self):
         """Clear all effects"""
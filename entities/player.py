@@ -2,8 +2,88 @@
 Player entity for the game (crosshair control)
 """
 import pygame
+from collections import OrderedDict
 from core.settings import CROSSHAIR_SIZE, VALORANT_RED
 
+# Crosshair surfaces memoized by (style, color, size) so toggling styles
+# in the settings menu doesn't redraw the same primitives
+_crosshair_cache = OrderedDict()
+_CROSSHAIR_CACHE_MAX = 32
+
+def _build_crosshair(style, color, size):
+    """
+    Draw a crosshair surface for the given style, color and size
+
+    Args:
+        style (str): Crosshair style ("default", "dot", "circle", "valorant")
+        color (tuple): RGB color tuple
+        size (int): Size of the crosshair
+
+    Returns:
+        pygame.Surface: The crosshair surface
+    """
+    surface = pygame.Surface((size, size), pygame.SRCALPHA)
+
+    if style == "default":
+        # Draw a simple crosshair
+        thickness = max(1, size // 10)
+        gap = size // 4
+
+        # Horizontal line
+        pygame.draw.rect(surface, color,
+                        (0, size // 2 - thickness // 2,
+                         size // 2 - gap, thickness))
+        pygame.draw.rect(surface, color,
+                        (size // 2 + gap, size // 2 - thickness // 2,
+                         size // 2 - gap, thickness))
+
+        # Vertical line
+        pygame.draw.rect(surface, color,
+                        (size // 2 - thickness // 2, 0,
+                         thickness, size // 2 - gap))
+        pygame.draw.rect(surface, color,
+                        (size // 2 - thickness // 2, size // 2 + gap,
+                         thickness, size // 2 - gap))
+
+        # Center dot
+        pygame.draw.circle(surface, color,
+                          (size // 2, size // 2), thickness)
+
+    elif style == "dot":
+        # Just a simple dot
+        pygame.draw.circle(surface, color,
+                          (size // 2, size // 2), size // 6)
+
+    elif style == "circle":
+        # Circle crosshair
+        thickness = max(1, size // 20)
+        pygame.draw.circle(surface, color,
+                          (size // 2, size // 2), size // 3, thickness)
+        pygame.draw.circle(surface, color,
+                          (size // 2, size // 2), size // 10)
+
+    elif style == "valorant":
+        # Valorant-style crosshair
+        thickness = max(1, size // 15)
+        gap = size // 5
+        outer_length = size // 3
+
+        # Outer lines
+        pygame.draw.rect(surface, color,
+                        (0, size // 2 - thickness // 2,
+                         outer_length, thickness))
+        pygame.draw.rect(surface, color,
+                        (size - outer_length, size // 2 - thickness // 2,
+                         outer_length, thickness))
+        pygame.draw.rect(surface, color,
+                        (size // 2 - thickness // 2, 0,
+                         thickness, outer_length))
+        pygame.draw.rect(surface, color,
+                        (size // 2 - thickness // 2, size - outer_length,
+                         thickness, outer_length))
+
+    return surface
+
 class Player:
     """
     Player class that handles crosshair and shooting
@@ -27,8 +107,8 @@ class Player:
         self.ammo = 30
         self.max_ammo = 30
         self.reloading = False
-        self.reload_start_time = 0
         self.reload_time = 1500  # milliseconds
+        self._reload_end = 0
         
         # Stats
         self.shots_fired = 0
@@ -37,108 +117,43 @@ class Player:
         
     def create_crosshair(self):
         """
-        Create the crosshair surface
-        
+        Get the crosshair surface for the current style settings
+
+        Returns the memoized surface when this (style, color, size) combo
+        has been built before.
+
         Returns:
             pygame.Surface: The crosshair surface
         """
-        size = self.crosshair_size
-        surface = pygame.Surface((size, size), pygame.SRCALPHA)
-        
-        if self.crosshair_style == "default":
-            # Draw a simple crosshair
-            thickness = max(1, size // 10)
-            gap = size // 4
-            
-            # Horizontal line
-            pygame.draw.rect(surface, self.crosshair_color, 
-                            (0, size // 2 - thickness // 2, 
-                             size // 2 - gap, thickness))
-            pygame.draw.rect(surface, self.crosshair_color, 
-                            (size // 2 + gap, size // 2 - thickness // 2, 
-                             size // 2 - gap, thickness))
-            
-            # Vertical line
-            pygame.draw.rect(surface, self.crosshair_color, 
-                            (size // 2 - thickness // 2, 0, 
-                             thickness, size // 2 - gap))
-            pygame.draw.rect(surface, self.crosshair_color, 
-                            (size // 2 - thickness // 2, size // 2 + gap, 
-                             thickness, size // 2 - gap))
-            
-            # Center dot
-            pygame.draw.circle(surface, self.crosshair_color, 
-                              (size // 2, size // 2), thickness)
-            
-        elif self.crosshair_style == "dot":
-            # Just a simple dot
-            pygame.draw.circle(surface, self.crosshair_color, 
-                              (size // 2, size // 2), size // 6)
-            
-        elif self.crosshair_style == "circle":
-            # Circle crosshair
-            thickness = max(1, size // 20)
-            pygame.draw.circle(surface, self.crosshair_color, 
-                              (size // 2, size // 2), size // 3, thickness)
-            pygame.draw.circle(surface, self.crosshair_color, 
-                              (size // 2, size // 2), size // 10)
-            
-        elif self.crosshair_style == "valorant":
-            # Valorant-style crosshair
-            thickness = max(1, size // 15)
-            gap = size // 5
-            outer_length = size // 3
-            
-            # Outer lines
-            pygame.draw.rect(surface, self.crosshair_color, 
-                            (0, size // 2 - thickness // 2, 
-                             outer_length, thickness))
-            pygame.draw.rect(surface, self.crosshair_color, 
-                            (size - outer_length, size // 2 - thickness // 2, 
-                             outer_length, thickness))
-            pygame.draw.rect(surface, self.crosshair_color, 
-                            (size // 2 - thickness // 2, 0, 
-                             thickness, outer_length))
-            pygame.draw.rect(surface, self.crosshair_color, 
-                            (size // 2 - thickness // 2, size - outer_length, 
-                             thickness, outer_length))
-            
+        key = (self.crosshair_style, tuple(self.crosshair_color), self.crosshair_size)
+        surface = _crosshair_cache.get(key)
+        if surface is None:
+            surface = _build_crosshair(self.crosshair_style,
+                                       self.crosshair_color,
+                                       self.crosshair_size)
+            _crosshair_cache[key] = surface
+            if len(_crosshair_cache) > _CROSSHAIR_CACHE_MAX:
+                _crosshair_cache.popitem(last=False)
+        else:
+            _crosshair_cache.move_to_end(key)
         return surface
-        
-    def update(self):
-        """Update the player state"""
-        # Get the game instance to check if we're in fullscreen mode
-        game = pygame.display.get_surface()
-        fullscreen = pygame.display.get_surface().get_flags() & pygame.FULLSCREEN
-        
-        # Update crosshair position to follow the mouse position
-        mouse_pos = pygame.mouse.get_pos()
-        
-        # If we're in fullscreen mode, we need to scale the mouse position
-        if fullscreen:
-            # Get the game's actual resolution
-            game_width = 1024  # SCREEN_WIDTH
-            game_height = 768  # SCREEN_HEIGHT
-            
-            # Get the screen's resolution
-            screen_width = pygame.display.get_surface().get_width()
-            screen_height = pygame.display.get_surface().get_height()
-            
-            # Calculate scale factors
-            scale_x = game_width / screen_width
-            scale_y = game_height / screen_height
-            
-            # Scale the mouse position
-            mouse_pos = (int(mouse_pos[0] * scale_x), int(mouse_pos[1] * scale_y))
-        
+
+    def update(self, mouse_pos, now):
+        """
+        Update the player state
+
+        Args:
+            mouse_pos (tuple): Mouse position sampled once for this frame
+            now (int): Current frame timestamp from pygame.time.get_ticks()
+        """
+        # The SCALED display hands us mouse coordinates in logical game
+        # space already, so no per-frame display polling or rescaling
         self.crosshair_rect.center = mouse_pos
         
         # Check if reloading is complete
-        if self.reloading:
-            current_time = pygame.time.get_ticks()
-            if current_time - self.reload_start_time >= self.reload_time:
-                self.ammo = self.max_ammo
-                self.reloading = False
+        if self.reloading and now >= self._reload_end:
+            self.ammo = self.max_ammo
+            self.reloading = False
                 
     def draw(self, surface):
         """
@@ -146,15 +161,20 @@ class Player:
         
         Args:
             surface (pygame.Surface): Surface to draw on
+
+        Returns:
+            list: Rectangles touched by the draw, for dirty-rect updates
         """
         surface.blit(self.crosshair, self.crosshair_rect)
+        return [self.crosshair_rect]
         
-    def shoot(self, target_manager):
+    def shoot(self, target_manager, pos=None):
         """
         Handle shooting logic
         
         Args:
             target_manager (TargetManager): The target manager to check for hits
+            pos (tuple, optional): Shot position; defaults to the mouse position
             
         Returns:
             Target or None: The hit target or None if no target was hit
@@ -166,10 +186,11 @@ class Player:
         self.ammo -= 1
         self.shots_fired += 1
         
-        # Check if we hit a target using the mouse position
-        mouse_pos = pygame.mouse.get_pos()
+        # Check if we hit a target at the shot position
+        if pos is None:
+            pos = pygame.mouse.get_pos()
         hit_radius = 8  # pixels - small hit forgiveness radius
-        hit_target = target_manager.check_hit(mouse_pos, hit_radius)
+        hit_target = target_manager.check_hit(pos, hit_radius)
         
         if hit_target:
             self.shots_hit += 1
@@ -186,7 +207,9 @@ class Player:
         """Start reloading"""
         if not self.reloading and self.ammo < self.max_ammo:
             self.reloading = True
-            self.reload_start_time = pygame.time.get_ticks()
+            # Store when the reload finishes so the per-frame check is a
+            # single comparison
+            self._reload_end = pygame.time.get_ticks() + self.reload_time
             
     def set_crosshair_style(self, style, color=None, size=None):
         """
@@ -197,22 +220,22 @@ class Player:
             color (tuple, optional): RGB color tuple
             size (int, optional): Size of the crosshair
         """
+        new_color = color if color else self.crosshair_color
+        new_size = size if size else self.crosshair_size
+
+        # Settings dialogs re-emit current values; skip the rebuild when
+        # nothing actually changed
+        if (style == self.crosshair_style and new_color == self.crosshair_color
+                and new_size == self.crosshair_size):
+            return
+
         self.crosshair_style = style
-        
-        if color:
-            self.crosshair_color = color
-            
-        if size:
-            self.crosshair_size = size
-            
-        # Recreate the crosshair with new settings
+        self.crosshair_color = new_color
+        self.crosshair_size = new_size
+
+        # Recreate the crosshair with new settings, keeping its position
         self.crosshair = self.create_crosshair()
-        self.crosshair_rect = self.crosshair.get_rect()
-        
-        # Reset position to center
-        screen_width = pygame.display.get_surface().get_width()
-        screen_height = pygame.display.get_surface().get_height()
-        self.crosshair_rect.center = (screen_width // 2, screen_height // 2)
+        self.crosshair_rect = self.crosshair.get_rect(center=self.crosshair_rect.center)
         
     def get_accuracy(self):
         """
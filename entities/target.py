@@ -1,18 +1,46 @@
 """
 Target entity for the game
 """
+import math
 import random
+import numpy as np
 import pygame
 from core.settings import (
-    SCREEN_WIDTH, SCREEN_HEIGHT, TARGET_SIZE_MIN, TARGET_SIZE_MAX,
-    TARGET_SPEED_MIN, TARGET_SPEED_MAX, TARGET_LIFETIME_MIN, TARGET_LIFETIME_MAX
+    SCREEN_WIDTH, SCREEN_HEIGHT, DIFFICULTY_MODIFIERS, MAX_TARGETS,
+    TARGET_SIZE_MIN, TARGET_SIZE_MAX, TARGET_SPEED_MIN, TARGET_SPEED_MAX,
+    TARGET_LIFETIME_MIN, TARGET_LIFETIME_MAX
 )
+from core.particle_kernels import step_targets as _step_targets_njit
+
+try:
+    from scipy.spatial import cKDTree
+except ImportError:
+    cKDTree = None
+
+# Unit vertices of the spike target's hexagon, computed once instead of
+# rotating a Vector2 per vertex per spawn
+_HEX_UNIT = [(math.cos(math.radians(i * 60)), math.sin(math.radians(i * 60)))
+             for i in range(6)]
 
 class Target(pygame.sprite.Sprite):
     """
     Target class for the game
     """
-    def __init__(self, target_type="standard", size=None, lifetime=None, speed=None):
+    # Finished target surfaces shared by (type, size); sprites never
+    # mutate their image, so instances can alias the same surface
+    _surface_cache = {}
+
+    # Fixed attribute set: slotted attributes resolve through descriptors
+    # instead of the instance dict. The Sprite base still carries a dict
+    # for its own bookkeeping, so the benefit is lookup speed rather than
+    # the full per-instance memory saving
+    __slots__ = (
+        "type", "size", "lifetime", "speed", "image", "rect", "vx", "vy",
+        "spawn_time", "time_alive", "hit", "hit_time", "slot",
+        "tracked", "track_start_time", "total_tracked_time",
+    )
+
+    def __init__(self, target_type="standard", size=None, lifetime=None, speed=None, now=None):
         """
         Initialize a target
         
@@ -21,6 +49,7 @@ class Target(pygame.sprite.Sprite):
             size (int, optional): Size of the target
             lifetime (int, optional): Lifetime of the target in milliseconds
             speed (float, optional): Movement speed of the target
+            now (int, optional): Current timestamp; sampled when omitted
         """
         super().__init__()
         
@@ -30,22 +59,24 @@ class Target(pygame.sprite.Sprite):
         self.lifetime = lifetime if lifetime else random.randint(TARGET_LIFETIME_MIN, TARGET_LIFETIME_MAX)
         self.speed = speed if speed else random.uniform(TARGET_SPEED_MIN, TARGET_SPEED_MAX)
         
-        # Create the target surface
-        self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
-        self.draw_target()
+        # Reuse the rendered surface for this (type, size) if one exists
+        key = (self.type, self.size)
+        self.image = Target._surface_cache.get(key)
+        if self.image is None:
+            self.image = pygame.Surface((self.size, self.size), pygame.SRCALPHA)
+            self.draw_target()
+            Target._surface_cache[key] = self.image
         
         # Set up the rect and position
         self.rect = self.image.get_rect()
         self.spawn()
         
-        # Movement
-        self.velocity = pygame.Vector2(
-            random.uniform(-self.speed, self.speed),
-            random.uniform(-self.speed, self.speed)
-        )
+        # Movement; plain floats, mirrored into the manager's arrays
+        self.vx = random.uniform(-self.speed, self.speed)
+        self.vy = random.uniform(-self.speed, self.speed)
         
         # Timing
-        self.spawn_time = pygame.time.get_ticks()
+        self.spawn_time = now if now is not None else pygame.time.get_ticks()
         self.time_alive = 0
         self.hit = False
         self.hit_time = 0
@@ -90,13 +121,11 @@ class Target(pygame.sprite.Sprite):
         elif self.type == "spike":
             # Core node for spike mode
             pygame.draw.circle(self.image, (18, 184, 253), (self.size // 2, self.size // 2), self.size // 2)
-            # Draw a hexagon pattern
-            points = []
-            for i in range(6):
-                angle = i * (360 / 6)
-                x = self.size // 2 + int((self.size // 3) * pygame.math.Vector2(1, 0).rotate(angle).x)
-                y = self.size // 2 + int((self.size // 3) * pygame.math.Vector2(1, 0).rotate(angle).y)
-                points.append((x, y))
+            # Draw a hexagon pattern from the precomputed unit vertices
+            center = self.size // 2
+            radius = self.size // 3
+            points = [(center + int(radius * ux), center + int(radius * uy))
+                      for ux, uy in _HEX_UNIT]
             pygame.draw.polygon(self.image, (255, 255, 255), points)
             pygame.draw.circle(self.image, (18, 184, 253), (self.size // 2, self.size // 2), self.size // 6)
     
@@ -107,31 +136,16 @@ class Target(pygame.sprite.Sprite):
         self.rect.x = random.randint(padding, SCREEN_WIDTH - padding)
         self.rect.y = random.randint(padding, SCREEN_HEIGHT - padding)
         
-    def update(self):
-        """Update the target's position and check if it should be removed"""
-        current_time = pygame.time.get_ticks()
-        self.time_alive = current_time - self.spawn_time
-        
-        # Move the target if it hasn't been hit
-        if not self.hit:
-            self.rect.x += self.velocity.x
-            self.rect.y += self.velocity.y
-            
-            # Bounce off the edges of the screen
-            if self.rect.left < 0 or self.rect.right > SCREEN_WIDTH:
-                self.velocity.x *= -1
-            if self.rect.top < 0 or self.rect.bottom > SCREEN_HEIGHT:
-                self.velocity.y *= -1
-                
-        # Check if the target should be removed due to lifetime
-        if self.time_alive >= self.lifetime:
-            self.kill()
-            
-    def get_hit(self):
-        """Mark the target as hit and record the hit time"""
+    def get_hit(self, now=None):
+        """
+        Mark the target as hit and record the hit time
+
+        Args:
+            now (int, optional): Current timestamp; sampled when omitted
+        """
         if not self.hit:
             self.hit = True
-            self.hit_time = pygame.time.get_ticks()
+            self.hit_time = now if now is not None else pygame.time.get_ticks()
             return True
         return False
     
@@ -168,6 +182,16 @@ class Target(pygame.sprite.Sprite):
         return (total_time / self.time_alive) * 100
 
 
+# Broad-phase grid parameters: cell size comfortably holds one target,
+# and the grid is only maintained once enough targets are live for the
+# vectorized all-pairs test to be worth narrowing
+GRID_CELL = TARGET_SIZE_MAX * 2
+GRID_MIN_TARGETS = 32
+
+# Above this live count a KD-tree query beats walking grid cells; only
+# used when scipy is installed
+KDTREE_MIN_TARGETS = 128
+
 class TargetManager:
     """
     Manages the creation, updating, and removal of targets
@@ -183,16 +207,43 @@ class TargetManager:
         self.game_mode = game_mode
         self.difficulty = difficulty
         self.targets = pygame.sprite.Group()
-        self.last_spawn_time = 0
+        # Anchored to the first update() call; a fixed start value
+        # would make the catch-up logic treat everything before the
+        # first playing frame (program start, the countdown) as missed
+        # spawns and flood that frame
+        self.last_spawn_time = None
         self.spawn_delay = TARGET_LIFETIME_MIN  # Will be adjusted based on difficulty
         self.adjust_difficulty(difficulty)
+        # Timestamp of the current frame, refreshed by update(); lets the
+        # click path stamp hits without another clock read
+        self._now = 0
+
+        # Struct-of-arrays state for the live targets, indexed by slot.
+        # Position integration, edge bouncing and lifetime culling run as
+        # vectorized operations over these; the sprites are thin views
+        # whose rects are refreshed once per frame for drawing.
+        self.pos = np.zeros((MAX_TARGETS, 2), dtype=np.float32)
+        self.vel = np.zeros((MAX_TARGETS, 2), dtype=np.float32)
+        self.size_arr = np.zeros(MAX_TARGETS, dtype=np.float32)
+        self.spawn_time_arr = np.zeros(MAX_TARGETS, dtype=np.int32)
+        self.lifetime_arr = np.ones(MAX_TARGETS, dtype=np.int32)
+        self.alive = np.zeros(MAX_TARGETS, dtype=bool)
+        self.hit_mask = np.zeros(MAX_TARGETS, dtype=bool)
+        self._slots = [None] * MAX_TARGETS
+        # Cell -> slot list broad-phase grid; None while below the gate
+        self._grid = None
+        # (tree, slot indices) KD-tree broad phase; None unless the live
+        # count crosses KDTREE_MIN_TARGETS and scipy is available
+        self._tree = None
         
         # Stats
         self.targets_spawned = 0
         self.targets_hit = 0
         self.targets_missed = 0
         self.headshots = 0
-        self.reaction_times = []
+        # Running sum/count so the per-frame average is O(1)
+        self._rt_sum = 0
+        self._rt_count = 0
         
     def adjust_difficulty(self, difficulty):
         """
@@ -201,28 +252,27 @@ class TargetManager:
         Args:
             difficulty (str): Difficulty level
         """
-        from core.settings import DIFFICULTY_MODIFIERS
-        
         self.difficulty = difficulty
-        modifiers = DIFFICULTY_MODIFIERS.get(difficulty, DIFFICULTY_MODIFIERS["medium"])
+        # Resolve the modifiers once; spawn_target reads the cached tuple
+        # instead of doing a dict lookup per spawn
+        self._modifiers = DIFFICULTY_MODIFIERS.get(difficulty, DIFFICULTY_MODIFIERS["medium"])
         
         # Adjust spawn rate based on difficulty
-        self.spawn_delay = int(TARGET_LIFETIME_MIN * modifiers["spawn_rate_multiplier"])
+        self.spawn_delay = int(TARGET_LIFETIME_MIN * self._modifiers.spawn_rate)
         
-    def spawn_target(self, target_type=None):
+    def spawn_target(self, target_type=None, now=None):
         """
         Spawn a new target
         
         Args:
             target_type (str, optional): Type of target to spawn
+            now (int, optional): Current timestamp; sampled when omitted
         """
-        from core.settings import DIFFICULTY_MODIFIERS, MAX_TARGETS
-        
         # Don't spawn if we've reached the maximum number of targets
         if len(self.targets) >= MAX_TARGETS:
             return
             
-        modifiers = DIFFICULTY_MODIFIERS.get(self.difficulty, DIFFICULTY_MODIFIERS["medium"])
+        modifiers = self._modifiers
         
         # Determine target type based on game mode if not specified
         if target_type is None:
@@ -240,36 +290,136 @@ class TargetManager:
                 target_type = "standard"
                 
         # Create the target with difficulty-adjusted parameters
-        size = int(random.randint(TARGET_SIZE_MIN, TARGET_SIZE_MAX) * modifiers["target_size_multiplier"])
-        lifetime = int(random.randint(TARGET_LIFETIME_MIN, TARGET_LIFETIME_MAX) * modifiers["target_lifetime_multiplier"])
-        speed = random.uniform(TARGET_SPEED_MIN, TARGET_SPEED_MAX) * modifiers["target_speed_multiplier"]
+        size = int(random.randint(TARGET_SIZE_MIN, TARGET_SIZE_MAX) * modifiers.size)
+        lifetime = int(random.randint(TARGET_LIFETIME_MIN, TARGET_LIFETIME_MAX) * modifiers.lifetime)
+        speed = random.uniform(TARGET_SPEED_MIN, TARGET_SPEED_MAX) * modifiers.speed
         
-        target = Target(target_type, size, lifetime, speed)
+        target = Target(target_type, size, lifetime, speed, now)
         self.targets.add(target)
         self.targets_spawned += 1
+
+        # Claim a free slot in the arrays for this target's mutable state
+        slot = int(np.argmin(self.alive))
+        target.slot = slot
+        self._slots[slot] = target
+        self.alive[slot] = True
+        self.hit_mask[slot] = False
+        self.pos[slot] = target.rect.topleft
+        self.vel[slot] = (target.vx, target.vy)
+        self.size_arr[slot] = target.size
+        self.spawn_time_arr[slot] = target.spawn_time
+        self.lifetime_arr[slot] = target.lifetime
         
         return target
         
-    def update(self):
-        """Update all targets and spawn new ones if needed"""
-        current_time = pygame.time.get_ticks()
-        
-        # Spawn new targets based on spawn rate
-        if current_time - self.last_spawn_time > self.spawn_delay:
-            self.spawn_target()
-            self.last_spawn_time = current_time
+    def update(self, now):
+        """
+        Update all targets and spawn new ones if needed
+
+        Args:
+            now (int): Current frame timestamp from pygame.time.get_ticks()
+        """
+        # Spawn targets based on spawn rate, catching up if a slow frame
+        # left more than one interval elapsed
+        self._now = now
+        if self.last_spawn_time is None:
+            self.last_spawn_time = now
+        pending = (now - self.last_spawn_time) // self.spawn_delay
+        if pending:
+            for _ in range(min(int(pending), MAX_TARGETS - len(self.targets))):
+                self.spawn_target(now=now)
+            # Advance by whole intervals so the spawn cadence stays steady
+            self.last_spawn_time += int(pending) * self.spawn_delay
             
-        # Update all targets
-        self.targets.update()
+        alive = self.alive
+        if not alive.any():
+            return
+
+        ages = now - self.spawn_time_arr
+        if _step_targets_njit is not None:
+            # Fused compiled kernel: integrate, bounce and expire in one pass
+            dead = np.zeros(MAX_TARGETS, dtype=bool)
+            _step_targets_njit(self.pos, self.vel, self.size_arr,
+                               self.spawn_time_arr, self.lifetime_arr,
+                               alive, dead, now, SCREEN_WIDTH, SCREEN_HEIGHT)
+        else:
+            # Integrate positions and bounce off the screen edges,
+            # vectorized over every live target at once
+            self.pos[alive] += self.vel[alive]
+            bounce_x = alive & ((self.pos[:, 0] < 0) |
+                                (self.pos[:, 0] + self.size_arr > SCREEN_WIDTH))
+            bounce_y = alive & ((self.pos[:, 1] < 0) |
+                                (self.pos[:, 1] + self.size_arr > SCREEN_HEIGHT))
+            self.vel[bounce_x, 0] *= -1
+            self.vel[bounce_y, 1] *= -1
+
+            # Cull targets that outlived their lifetime
+            dead = alive & (ages >= self.lifetime_arr)
+
+        # Refresh the sprite views from the arrays
+        for slot in np.nonzero(alive)[0]:
+            target = self._slots[slot]
+            target.time_alive = int(ages[slot])
+            if dead[slot]:
+                self._free_slot(slot)
+                target.kill()
+            else:
+                target.rect.x = int(self.pos[slot, 0])
+                target.rect.y = int(self.pos[slot, 1])
+
+        self._rebuild_grid()
+
+    def _rebuild_grid(self):
+        """
+        Rebuild the broad-phase grid for this frame
+
+        Only worthwhile past GRID_MIN_TARGETS live targets; below that the
+        vectorized all-pairs hit-test is cheaper than grid upkeep, so the
+        grid stays disabled.
+        """
+        count = int(np.count_nonzero(self.alive))
+        if count < GRID_MIN_TARGETS:
+            self._grid = None
+            self._tree = None
+            return
+        if cKDTree is not None and count >= KDTREE_MIN_TARGETS:
+            # Dense enough that a KD-tree over the centers pays off
+            slots = np.nonzero(self.alive)[0]
+            half = self.size_arr[slots, None] / 2
+            self._tree = (cKDTree(self.pos[slots] + half), slots)
+            self._grid = None
+            return
+        self._tree = None
+        grid = {}
+        half = self.size_arr / 2
+        for slot in np.nonzero(self.alive)[0]:
+            key = (int((self.pos[slot, 0] + half[slot]) // GRID_CELL),
+                   int((self.pos[slot, 1] + half[slot]) // GRID_CELL))
+            grid.setdefault(key, []).append(int(slot))
+        self._grid = grid
+
+    def _free_slot(self, slot):
+        """Release a target's slot in the state arrays"""
+        self.alive[slot] = False
+        self._slots[slot] = None
         
     def draw(self, surface):
         """
         Draw all targets on the surface
-        
+
         Args:
             surface (pygame.Surface): Surface to draw on
+
+        Returns:
+            list: Rectangles touched by the draw, for dirty-rect updates
         """
-        self.targets.draw(surface)
+        # Batch all target blits into one C-level call instead of a Python
+        # loop of per-sprite blits; doreturn=0 skips allocating clipped
+        # result rects, the sprites' own rects serve as the dirty list
+        targets = self.targets
+        surface.blits([(target.image, target.rect) for target in targets],
+                      doreturn=0)
+        return [target.rect for target in targets]
         
     def check_hit(self, pos, hit_radius=0):
         """
@@ -282,18 +432,49 @@ class TargetManager:
         Returns:
             Target or None: The hit target or None if no target was hit
         """
-        for target in self.targets:
-            # Calculate distance from position to target center
-            target_center = target.rect.center
-            distance = pygame.math.Vector2(pos[0] - target_center[0], pos[1] - target_center[1]).length()
-            
-            # Check if the position is within the target radius plus the hit radius
-            if distance <= (target.size / 2) + hit_radius and not target.hit:
-                target.get_hit()
+        candidates = self.alive & ~self.hit_mask
+        if self._tree is not None:
+            tree, slots = self._tree
+            # Query with the largest live radius: difficulty modifiers
+            # scale sizes past TARGET_SIZE_MAX, and a constant bound
+            # would drop rim hits on those oversized targets
+            max_half = float(self.size_arr[slots].max()) / 2
+            nearby = tree.query_ball_point(pos, max_half + hit_radius)
+            narrowed = np.zeros(MAX_TARGETS, dtype=bool)
+            narrowed[slots[nearby]] = True
+            candidates = candidates & narrowed
+        elif self._grid is not None:
+            # Narrow to the query cell and its eight neighbors
+            cx = int(pos[0] // GRID_CELL)
+            cy = int(pos[1] // GRID_CELL)
+            nearby = []
+            for gx in (cx - 1, cx, cx + 1):
+                for gy in (cy - 1, cy, cy + 1):
+                    nearby.extend(self._grid.get((gx, gy), ()))
+            narrowed = np.zeros(MAX_TARGETS, dtype=bool)
+            narrowed[nearby] = True
+            candidates = candidates & narrowed
+        if candidates.any():
+            # Squared-distance test over all candidates at once: no sqrt,
+            # no Vector2 allocation, no Python loop
+            half = self.size_arr / 2
+            dx = self.pos[:, 0] + half - pos[0]
+            dy = self.pos[:, 1] + half - pos[1]
+            radius = half + hit_radius
+            hits = candidates & (dx * dx + dy * dy <= radius * radius)
+            slots = np.nonzero(hits)[0]
+            if slots.size:
+                slot = int(slots[0])
+                target = self._slots[slot]
+                target.get_hit(self._now)
+                # Hit targets stop moving while their hit marker lingers
+                self.hit_mask[slot] = True
+                self.vel[slot] = 0
                 
                 # Record stats
                 self.targets_hit += 1
-                self.reaction_times.append(target.get_reaction_time())
+                self._rt_sum += target.get_reaction_time()
+                self._rt_count += 1
                 
                 if target.type == "headshot":
                     self.headshots += 1
@@ -323,9 +504,9 @@ class TargetManager:
         Returns:
             float: Average reaction time in milliseconds
         """
-        if not self.reaction_times:
+        if self._rt_count == 0:
             return 0
-        return sum(self.reaction_times) / len(self.reaction_times)
+        return self._rt_sum / self._rt_count
         
     def reset_stats(self):
         """Reset all statistics"""
@@ -333,8 +514,11 @@ class TargetManager:
         self.targets_hit = 0
         self.targets_missed = 0
         self.headshots = 0
-        self.reaction_times = []
+        self._rt_sum = 0
+        self._rt_count = 0
         
     def clear_targets(self):
         """Remove all targets"""
         self.targets.empty()
+        self.alive[:] = False
+        self._slots = [None] * MAX_TARGETS
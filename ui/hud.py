@@ -3,7 +3,7 @@ Heads-up display for the game
 """
 import pygame
 from core.settings import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, VALORANT_RED, VALORANT_BLUE
-from core.utils import draw_text, format_time
+from core.utils import draw_text, format_time, render_text
 
 class HUD:
     """
@@ -28,6 +28,58 @@ class HUD:
         self.reaction_time = 0
         self.fps = 0
         self.time_left = 0
+
+        # Cached FPS text; re-rendered only when the displayed value changes
+        self._fps_text = None
+        self._fps_surface = None
+
+        # Static label prefixes rendered once; the dynamic values next to
+        # them re-render only when their text changes
+        self._label_score = self.font_medium.render("Score: ", True, WHITE)
+        self._label_accuracy = self.font_medium.render("Accuracy: ", True, WHITE)
+        self._label_hits = self.font_medium.render("Hits: ", True, WHITE)
+        self._label_headshots = self.font_medium.render("Headshots: ", True, WHITE)
+        self._label_reaction = self.font_medium.render("Avg. Reaction: ", True, WHITE)
+        self._label_time = self.font_medium.render("Time: ", True, WHITE)
+        # Per-slot (text, surface) pairs for the dynamic values
+        self._values = {}
+        # Mode/difficulty line is fixed for a session; rendered lazily
+        self._mode_line = None
+
+        # Composited HUD band plus the value snapshot it was drawn from;
+        # steady frames reblit it without re-rendering anything
+        self._hud_surface = pygame.Surface((SCREEN_WIDTH, 170), pygame.SRCALPHA)
+        self._hud_state = None
+
+        # Reusable dimming overlays for the countdown and menu screens,
+        # built once instead of allocating a full-screen surface per frame
+        self._overlay_128 = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self._overlay_128.fill((0, 0, 0, 128))
+        self._overlay_192 = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
+        self._overlay_192.fill((0, 0, 0, 192))
+
+    def _value_surface(self, slot, text, font):
+        """
+        Get the rendered surface for a dynamic HUD value
+
+        Re-renders only when the text for this slot changed since the
+        previous frame.
+
+        Args:
+            slot (str): Identifier for the HUD field
+            text (str): Current text of the field
+            font (pygame.font.Font): Font to render with
+
+        Returns:
+            pygame.Surface: The rendered value
+        """
+        cached = self._values.get(slot)
+        if cached is None or cached[0] != text:
+            # render_text memoizes globally, so values that oscillate
+            # between a few strings stop costing renders entirely
+            cached = (text, render_text(text, font, WHITE))
+            self._values[slot] = cached
+        return cached[1]
         
     def update(self, player, target_manager, fps, time_left):
         """
@@ -48,47 +100,76 @@ class HUD:
         self.fps = fps
         self.time_left = time_left
         
+    # Band along the top of the screen covering every HUD element
+    HUD_AREA = pygame.Rect(0, 0, SCREEN_WIDTH, 170)
+
     def draw(self, surface):
         """
         Draw the HUD on the surface
-        
+
         Args:
             surface (pygame.Surface): Surface to draw on
+
+        Returns:
+            list: Rectangles touched by the draw, for dirty-rect updates
         """
-        # Draw score
-        draw_text(surface, f"Score: {self.score}", self.font_medium, WHITE, 
-                 20, 20, "left")
-        
-        # Draw accuracy
-        draw_text(surface, f"Accuracy: {self.accuracy:.1f}%", self.font_medium, WHITE, 
-                 20, 50, "left")
-        
-        # Draw targets hit/missed
-        draw_text(surface, f"Hits: {self.targets_hit} | Misses: {self.targets_missed}", 
-                 self.font_medium, WHITE, 20, 80, "left")
-        
-        # Draw headshots
-        draw_text(surface, f"Headshots: {self.headshots}", self.font_medium, WHITE, 
-                 20, 110, "left")
-        
-        # Draw reaction time
-        draw_text(surface, f"Avg. Reaction: {self.reaction_time:.0f}ms", self.font_medium, 
-                 WHITE, 20, 140, "left")
-        
-        # Draw time left
         minutes = int(self.time_left // 60)
         seconds = int(self.time_left % 60)
-        draw_text(surface, f"Time: {minutes:02d}:{seconds:02d}", self.font_medium, WHITE, 
-                 SCREEN_WIDTH - 20, 20, "right")
-        
-        # Draw FPS
-        draw_text(surface, f"FPS: {self.fps}", self.font_small, WHITE, 
-                 SCREEN_WIDTH - 20, 50, "right")
-        
-        # Draw game mode and difficulty
-        draw_text(surface, f"Mode: {self.game_mode.capitalize()} | Difficulty: {self.difficulty.capitalize()}", 
-                 self.font_small, WHITE, SCREEN_WIDTH // 2, 20, "center")
-        
+        state = (self.score, round(self.accuracy, 1), self.targets_hit,
+                 self.targets_missed, self.headshots,
+                 int(self.reaction_time), self.fps, minutes, seconds)
+        if state != self._hud_state:
+            self._hud_state = state
+            self._compose(minutes, seconds)
+
+        surface.blit(self._hud_surface, (0, 0))
+        return [self.HUD_AREA]
+
+    def _compose(self, minutes, seconds):
+        """Re-render the HUD band after one of its values changed"""
+        target = self._hud_surface
+        target.fill((0, 0, 0, 0))
+
+        # Left column: static prefix, then the change-tracked value
+        rows = [
+            (self._label_score, "score", f"{self.score}", 20),
+            (self._label_accuracy, "accuracy", f"{self.accuracy:.1f}%", 50),
+            (self._label_hits, "hits",
+             f"{self.targets_hit} | Misses: {self.targets_missed}", 80),
+            (self._label_headshots, "headshots", f"{self.headshots}", 110),
+            (self._label_reaction, "reaction",
+             f"{self.reaction_time:.0f}ms", 140),
+        ]
+        for label, slot, text, y in rows:
+            target.blit(label, (20, y))
+            target.blit(self._value_surface(slot, text, self.font_medium),
+                        (20 + label.get_width(), y))
+        
+        # Draw time left, right-aligned as label + value
+        time_value = self._value_surface("time", f"{minutes:02d}:{seconds:02d}",
+                                         self.font_medium)
+        value_x = SCREEN_WIDTH - 20 - time_value.get_width()
+        target.blit(time_value, (value_x, 20))
+        target.blit(self._label_time,
+                    (value_x - self._label_time.get_width(), 20))
+        
+        # Draw FPS from the cached surface; font rendering is slow, so the
+        # text is only re-rendered when the value actually changes
+        fps_text = f"FPS: {self.fps}"
+        if fps_text != self._fps_text:
+            self._fps_text = fps_text
+            self._fps_surface = render_text(fps_text, self.font_small, WHITE)
+        target.blit(self._fps_surface,
+                    self._fps_surface.get_rect(topright=(SCREEN_WIDTH - 20, 50)))
+        
+        # Draw game mode and difficulty (fixed per session, rendered once)
+        if self._mode_line is None:
+            self._mode_line = render_text(
+                f"Mode: {self.game_mode.capitalize()} | Difficulty: {self.difficulty.capitalize()}",
+                self.font_small, WHITE)
+        target.blit(self._mode_line,
+                    self._mode_line.get_rect(center=(SCREEN_WIDTH // 2, 20)))
+
     def draw_countdown(self, surface, countdown):
         """
         Draw the countdown before the game starts
@@ -97,10 +178,8 @@ class HUD:
             surface (pygame.Surface): Surface to draw on
             countdown (int): Countdown value
         """
-        # Draw a semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 128))
-        surface.blit(overlay, (0, 0))
+        # Draw the cached semi-transparent overlay
+        surface.blit(self._overlay_128, (0, 0))
         
         # Draw the countdown number
         if countdown > 0:
@@ -117,10 +196,8 @@ class HUD:
         Args:
             surface (pygame.Surface): Surface to draw on
         """
-        # Draw a semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 192))
-        surface.blit(overlay, (0, 0))
+        # Draw the cached semi-transparent overlay
+        surface.blit(self._overlay_192, (0, 0))
         
         # Draw the pause title
         draw_text(surface, "PAUSED", self.font_large, WHITE, 
@@ -145,10 +222,8 @@ class HUD:
             score (int): Final score
             high_score (int): High score
         """
-        # Draw a semi-transparent overlay
-        overlay = pygame.Surface((SCREEN_WIDTH, SCREEN_HEIGHT), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 192))
-        surface.blit(overlay, (0, 0))
+        # Draw the cached semi-transparent overlay
+        surface.blit(self._overlay_192, (0, 0))
         
         # Draw the game over title
         draw_text(surface, "TRAINING COMPLETE", self.font_large, VALORANT_BLUE, 
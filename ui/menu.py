@@ -2,8 +2,13 @@
 Menu system for the game
 """
 import pygame
-from core.settings import SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, BLACK, VALORANT_RED, VALORANT_BLUE
-from core.utils import draw_text
+import numpy as np
+from core.settings import (
+    SCREEN_WIDTH, SCREEN_HEIGHT, WHITE, BLACK, VALORANT_RED, VALORANT_BLUE,
+    ACTION_START_TRAINING, ACTION_SETTINGS, ACTION_LEADERBOARD, ACTION_QUIT,
+    ACTION_BACK, ACTION_SAVE_EXIT
+)
+from core.utils import render_text, get_sysfont
 
 class Button:
     """
@@ -23,461 +28,491 @@ class Button:
             action (str, optional): Action to perform when clicked
         """
         self.rect = pygame.Rect(x, y, width, height)
+        # Bounds cached as plain ints; buttons never move, and the
+        # inline compares below beat a collidepoint call per test
+        self._x0, self._y0 = x, y
+        self._x1, self._y1 = x + width, y + height
         self.text = text
         self.font = font
         self.action = action
         self.hovered = False
-        
+        # Rendered looks memoized per label, so buttons that cycle
+        # through a few texts (settings toggles) swap surfaces instead
+        # of re-rendering
+        self._surf_cache = {}
+        self._render()
+        self._surf_cache[text] = (self._surf_normal, self._surf_hover)
+
+    def _render(self):
+        """Pre-render the normal and hovered looks of the button"""
+        width, height = self.rect.size
+        text_surface = self.font.render(self.text, True, WHITE)
+        text_rect = text_surface.get_rect(center=(width // 2, height // 2))
+
+        self._surf_normal = pygame.Surface((width, height))
+        self._surf_normal.fill(BLACK)
+        pygame.draw.rect(self._surf_normal, VALORANT_RED,
+                         self._surf_normal.get_rect(), 2)
+        self._surf_normal.blit(text_surface, text_rect)
+
+        self._surf_hover = pygame.Surface((width, height))
+        self._surf_hover.fill(VALORANT_RED)
+        pygame.draw.rect(self._surf_hover, WHITE,
+                         self._surf_hover.get_rect(), 2)
+        self._surf_hover.blit(text_surface, text_rect)
+
+        # Match the display pixel format so every per-frame blit takes
+        # SDL's fast same-format path; buttons are opaque, so plain
+        # convert() is enough
+        self._surf_normal = self._surf_normal.convert()
+        self._surf_hover = self._surf_hover.convert()
+
+    def set_text(self, text):
+        """
+        Change the button label, re-rendering its cached surfaces
+
+        Args:
+            text (str): New button text
+        """
+        if text == self.text:
+            return
+        self.text = text
+        cached = self._surf_cache.get(text)
+        if cached is None:
+            self._render()
+            self._surf_cache[text] = (self._surf_normal, self._surf_hover)
+        else:
+            self._surf_normal, self._surf_hover = cached
+
     def update(self, mouse_pos):
         """
         Update the button state
-        
+
         Args:
             mouse_pos (tuple): Mouse position (x, y)
         """
-        self.hovered = self.rect.collidepoint(mouse_pos)
-        
+        mx, my = mouse_pos
+        self.hovered = (self._x0 <= mx < self._x1
+                        and self._y0 <= my < self._y1)
+
     def draw(self, surface):
         """
         Draw the button
-        
+
         Args:
             surface (pygame.Surface): Surface to draw on
         """
-        # Draw the button background
-        if self.hovered:
-            pygame.draw.rect(surface, VALORANT_RED, self.rect)
-            pygame.draw.rect(surface, WHITE, self.rect, 2)
-        else:
-            pygame.draw.rect(surface, BLACK, self.rect)
-            pygame.draw.rect(surface, VALORANT_RED, self.rect, 2)
-            
-        # Draw the button text
-        text_color = WHITE
-        text_surface = self.font.render(self.text, True, text_color)
-        text_rect = text_surface.get_rect(center=self.rect.center)
-        surface.blit(text_surface, text_rect)
+        # Both looks were rasterized up front, so drawing is one blit
+        surface.blit(self._surf_hover if self.hovered else self._surf_normal,
+                     self.rect)
         
-    def handle_event(self, event):
+    def _check_click(self, pos):
         """
-        Handle mouse events
-        
+        Check whether a click at pos lands on this button
+
+        The event-type filtering lives in the menus, so this is just the
+        containment test.
+
         Args:
-            event (pygame.event.Event): Mouse event
-            
+            pos (tuple): Click position (x, y)
+
         Returns:
-            str or None: The button's action if clicked, None otherwise
+            str or None: The button's action if hit, None otherwise
         """
-        if event.type == pygame.MOUSEBUTTONDOWN and event.button == 1:
-            if self.rect.collidepoint(event.pos):
-                return self.action
+        x, y = pos
+        if self._x0 <= x < self._x1 and self._y0 <= y < self._y1:
+            return self.action
         return None
 
 
-class MainMenu:
+def _button_rects(buttons):
     """
-    Main menu for the game
+    Pack button bounds into one array for vectorized hover tests
+
+    Args:
+        buttons (list): Buttons to pack
+
+    Returns:
+        numpy.ndarray: Nx4 array of (left, top, right, bottom)
     """
-    def __init__(self):
-        """Initialize the main menu"""
-        self.font_title = pygame.font.SysFont("arial", 48, bold=True)
-        self.font_subtitle = pygame.font.SysFont("arial", 24)
-        self.font_button = pygame.font.SysFont("arial", 20)
-        
-        # Create buttons
-        button_width = 200
-        button_height = 50
+    return np.array([[b.rect.x, b.rect.y, b.rect.right, b.rect.bottom]
+                     for b in buttons], dtype=np.int32)
+
+
+def _hover_mask(rects, pos):
+    """
+    Test a point against every packed button rect at once
+
+    Args:
+        rects (numpy.ndarray): Nx4 bounds from _button_rects
+        pos (tuple): Point to test (x, y)
+
+    Returns:
+        numpy.ndarray: Boolean mask of buttons containing the point
+    """
+    x, y = pos
+    return ((rects[:, 0] <= x) & (x < rects[:, 2])
+            & (rects[:, 1] <= y) & (y < rects[:, 3]))
+
+
+class ButtonMenu:
+    """
+    Base class for the column-of-buttons menus
+
+    Owns the machinery every such menu shares: a pre-rendered title
+    (plus any extra static lines a subclass registers), a tuple of
+    buttons with packed bounds for vectorized hover tests, optional
+    per-button hover descriptions, and the dirty flag the game loop
+    uses to skip redraws.
+    """
+    def __init__(self, title, title_color, title_center, options,
+                 button_y_start, descriptions=None, title_size=36,
+                 button_width=200, button_height=50, button_spacing=70):
+        """
+        Initialize the menu
+
+        Args:
+            title (str): Menu title text
+            title_color (tuple): RGB color of the title
+            title_center (tuple): Center position of the title
+            options (tuple): (label, action) pair per button, top down
+            button_y_start (int): Y position of the first button
+            descriptions (dict, optional): Hover description per action
+            title_size (int): Title font size
+            button_width (int): Button width
+            button_height (int): Button height
+            button_spacing (int): Vertical distance between button tops
+        """
+        self.font_title = get_sysfont("arial", title_size, bold=True)
+        self.font_button = get_sysfont("arial", 20)
+        self.font_description = get_sysfont("arial", 16)
+
+        # Static title text, rendered once
+        self._title = render_text(title, self.font_title, title_color)
+        self._title_pos = self._title.get_rect(center=title_center).topleft
+        # Extra (surface, pos) pairs a subclass wants drawn with the title
+        self._static = []
+
         button_x = SCREEN_WIDTH // 2 - button_width // 2
-        button_y_start = SCREEN_HEIGHT // 2
-        button_spacing = 70
-        
-        self.buttons = [
-            Button(button_x, button_y_start, button_width, button_height, 
-                  "Start Training", self.font_button, "Start Training"),
-            Button(button_x, button_y_start + button_spacing, button_width, button_height, 
-                  "Settings", self.font_button, "Settings"),
-            Button(button_x, button_y_start + button_spacing * 2, button_width, button_height, 
-                  "Leaderboard", self.font_button, "Leaderboard"),
-            Button(button_x, button_y_start + button_spacing * 3, button_width, button_height, 
-                  "Quit", self.font_button, "Quit")
-        ]
-        
+        self.buttons = tuple(
+            Button(button_x, button_y_start + i * button_spacing,
+                   button_width, button_height, label, self.font_button,
+                   action)
+            for i, (label, action) in enumerate(options)
+        )
+        self._rects = _button_rects(self.buttons)
+
+        # Description surfaces rendered once, keyed by button action
+        self.descriptions = descriptions or {}
+        self._desc_surfs = {}
+        for key, text in self.descriptions.items():
+            desc = render_text(text, self.font_description, WHITE)
+            pos = desc.get_rect(
+                center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100)).topleft
+            self._desc_surfs[key] = (desc, pos)
+        # Action of the hovered button that has a description, if any
+        self.hovered_option = None
+        # Redraw flag consumed by the game loop; set whenever something
+        # visible changed since the last draw
+        self.dirty = True
+
     def update(self, mouse_pos):
         """
         Update the menu
-        
+
         Args:
             mouse_pos (tuple): Mouse position (x, y)
         """
-        for button in self.buttons:
-            button.update(mouse_pos)
-            
+        # One vectorized containment test instead of a collidepoint per
+        # button
+        self.hovered_option = None
+        for button, hovered in zip(self.buttons,
+                                   _hover_mask(self._rects, mouse_pos)):
+            hovered = bool(hovered)
+            if hovered != button.hovered:
+                button.hovered = hovered
+                self.dirty = True
+            if hovered and button.action in self._desc_surfs:
+                self.hovered_option = button.action
+
     def draw(self, surface):
         """
         Draw the menu
-        
+
         Args:
             surface (pygame.Surface): Surface to draw on
         """
         # Background is now drawn in the main game class
-        
-        # Draw title
-        draw_text(surface, "NeuroShot", self.font_title, VALORANT_RED, 
-                 SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4 - 20, "center")
-        draw_text(surface, "Reflex Protocol", self.font_subtitle, VALORANT_BLUE, 
-                 SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4 + 30, "center")
-        
-        # Draw buttons
-        for button in self.buttons:
-            button.draw(surface)
-            
+
+        # Draw the pre-rendered title and any extra static lines
+        surface.blit(self._title, self._title_pos)
+        for static, pos in self._static:
+            surface.blit(static, pos)
+
+        # Draw buttons in one batched C-level call
+        surface.blits([(b._surf_hover if b.hovered else b._surf_normal,
+                        b.rect.topleft) for b in self.buttons], doreturn=0)
+
+        # Draw the hovered button's description
+        if self.hovered_option:
+            desc, pos = self._desc_surfs[self.hovered_option]
+            surface.blit(desc, pos)
+
     def handle_event(self, event):
         """
         Handle events
-        
+
         Args:
             event (pygame.event.Event): Event to handle
-            
+
         Returns:
             str or None: The action to perform, or None
         """
+        # Buttons only react to left clicks; bail before touching them
+        # for anything else
+        if event.type != pygame.MOUSEBUTTONDOWN or event.button != 1:
+            return None
+        pos = event.pos
         for button in self.buttons:
-            action = button.handle_event(event)
+            action = button._check_click(pos)
             if action:
                 return action
         return None
 
 
-class ModeSelectionMenu:
+class MainMenu(ButtonMenu):
+    """
+    Main menu for the game
+    """
+    def __init__(self):
+        """Initialize the main menu"""
+        super().__init__(
+            "NeuroShot", VALORANT_RED,
+            (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4 - 20),
+            (
+                ("Start Training", ACTION_START_TRAINING),
+                ("Settings", ACTION_SETTINGS),
+                ("Leaderboard", ACTION_LEADERBOARD),
+                ("Quit", ACTION_QUIT),
+            ),
+            SCREEN_HEIGHT // 2, title_size=48
+        )
+        self.font_subtitle = get_sysfont("arial", 24)
+        subtitle = render_text("Reflex Protocol", self.font_subtitle,
+                               VALORANT_BLUE)
+        self._static.append((subtitle, subtitle.get_rect(
+            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 4 + 30)).topleft))
+
+
+class ModeSelectionMenu(ButtonMenu):
     """
     Menu for selecting game mode
     """
     def __init__(self):
         """Initialize the mode selection menu"""
-        self.font_title = pygame.font.SysFont("arial", 36, bold=True)
-        self.font_button = pygame.font.SysFont("arial", 20)
-        self.font_description = pygame.font.SysFont("arial", 16)
-        
-        # Create buttons
-        button_width = 200
-        button_height = 50
-        button_x = SCREEN_WIDTH // 2 - button_width // 2
-        button_y_start = SCREEN_HEIGHT // 3
-        button_spacing = 70
-        
-        self.buttons = [
-            Button(button_x, button_y_start, button_width, button_height, 
-                  "Flick", self.font_button, "Flick"),
-            Button(button_x, button_y_start + button_spacing, button_width, button_height, 
-                  "Tracking", self.font_button, "Tracking"),
-            Button(button_x, button_y_start + button_spacing * 2, button_width, button_height, 
-                  "Switch", self.font_button, "Switch"),
-            Button(button_x, button_y_start + button_spacing * 3, button_width, button_height, 
-                  "Spike", self.font_button, "Spike"),
-            Button(button_x, button_y_start + button_spacing * 4, button_width, button_height, 
-                  "Back", self.font_button, "Back")
-        ]
-        
-        # Mode descriptions
-        self.descriptions = {
-            "Flick": "Test your reaction time and precision by hitting targets that appear randomly.",
-            "Tracking": "Keep your crosshair on moving targets for as long as possible.",
-            "Switch": "Quickly switch between multiple targets in sequence.",
-            "Spike": "Hit the core nodes while avoiding decoys, simulating spike defusal under pressure."
-        }
-        
-        self.hovered_mode = None
-        
-    def update(self, mouse_pos):
-        """
-        Update the menu
-        
-        Args:
-            mouse_pos (tuple): Mouse position (x, y)
-        """
-        self.hovered_mode = None
-        for button in self.buttons:
-            button.update(mouse_pos)
-            if button.hovered and button.action != "Back":
-                self.hovered_mode = button.action
-            
-    def draw(self, surface):
-        """
-        Draw the menu
-        
-        Args:
-            surface (pygame.Surface): Surface to draw on
-        """
-        # Background is now drawn in the main game class
-        
-        # Draw title
-        draw_text(surface, "Select Training Mode", self.font_title, WHITE, 
-                 SCREEN_WIDTH // 2, SCREEN_HEIGHT // 6, "center")
-        
-        # Draw buttons
-        for button in self.buttons:
-            button.draw(surface)
-            
-        # Draw mode description
-        if self.hovered_mode:
-            description = self.descriptions.get(self.hovered_mode, "")
-            draw_text(surface, description, self.font_description, WHITE, 
-                     SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100, "center")
-            
-    def handle_event(self, event):
-        """
-        Handle events
-        
-        Args:
-            event (pygame.event.Event): Event to handle
-            
-        Returns:
-            str or None: The action to perform, or None
-        """
-        for button in self.buttons:
-            action = button.handle_event(event)
-            if action:
-                return action
-        return None
+        super().__init__(
+            "Select Training Mode", WHITE,
+            (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 6),
+            (
+                ("Flick", "Flick"),
+                ("Tracking", "Tracking"),
+                ("Switch", "Switch"),
+                ("Spike", "Spike"),
+                ("Back", ACTION_BACK),
+            ),
+            SCREEN_HEIGHT // 3,
+            descriptions={
+                "Flick": "Test your reaction time and precision by hitting targets that appear randomly.",
+                "Tracking": "Keep your crosshair on moving targets for as long as possible.",
+                "Switch": "Quickly switch between multiple targets in sequence.",
+                "Spike": "Hit the core nodes while avoiding decoys, simulating spike defusal under pressure."
+            }
+        )
 
+    @property
+    def hovered_mode(self):
+        """str or None: Action of the hovered mode button"""
+        return self.hovered_option
 
-class DifficultyMenu:
+
+class DifficultyMenu(ButtonMenu):
     """
     Menu for selecting difficulty
     """
     def __init__(self, selected_mode):
         """
         Initialize the difficulty menu
-        
+
         Args:
             selected_mode (str): The selected game mode
         """
-        self.font_title = pygame.font.SysFont("arial", 36, bold=True)
-        self.font_mode = pygame.font.SysFont("arial", 24)
-        self.font_button = pygame.font.SysFont("arial", 20)
-        self.font_description = pygame.font.SysFont("arial", 16)
-        
+        super().__init__(
+            "Select Difficulty", WHITE,
+            (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 6),
+            (
+                ("Easy", "Easy"),
+                ("Medium", "Medium"),
+                ("Hard", "Hard"),
+                ("Extreme", "Extreme"),
+                ("Back", ACTION_BACK),
+            ),
+            SCREEN_HEIGHT // 3,
+            descriptions={
+                "Easy": "Larger, slower targets with longer lifetimes. Perfect for beginners.",
+                "Medium": "Balanced difficulty for regular practice.",
+                "Hard": "Smaller, faster targets with shorter lifetimes. For experienced players.",
+                "Extreme": "Tiny, very fast targets that disappear quickly. For elite players only."
+            }
+        )
         self.selected_mode = selected_mode
-        
-        # Create buttons
-        button_width = 200
-        button_height = 50
-        button_x = SCREEN_WIDTH // 2 - button_width // 2
-        button_y_start = SCREEN_HEIGHT // 3
-        button_spacing = 70
-        
-        self.buttons = [
-            Button(button_x, button_y_start, button_width, button_height, 
-                  "Easy", self.font_button, "Easy"),
-            Button(button_x, button_y_start + button_spacing, button_width, button_height, 
-                  "Medium", self.font_button, "Medium"),
-            Button(button_x, button_y_start + button_spacing * 2, button_width, button_height, 
-                  "Hard", self.font_button, "Hard"),
-            Button(button_x, button_y_start + button_spacing * 3, button_width, button_height, 
-                  "Extreme", self.font_button, "Extreme"),
-            Button(button_x, button_y_start + button_spacing * 4, button_width, button_height, 
-                  "Back", self.font_button, "Back")
-        ]
-        
-        # Difficulty descriptions
-        self.descriptions = {
-            "Easy": "Larger, slower targets with longer lifetimes. Perfect for beginners.",
-            "Medium": "Balanced difficulty for regular practice.",
-            "Hard": "Smaller, faster targets with shorter lifetimes. For experienced players.",
-            "Extreme": "Tiny, very fast targets that disappear quickly. For elite players only."
-        }
-        
-        self.hovered_difficulty = None
-        
-    def update(self, mouse_pos):
-        """
-        Update the menu
-        
-        Args:
-            mouse_pos (tuple): Mouse position (x, y)
-        """
-        self.hovered_difficulty = None
-        for button in self.buttons:
-            button.update(mouse_pos)
-            if button.hovered and button.action != "Back":
-                self.hovered_difficulty = button.action
-            
-    def draw(self, surface):
-        """
-        Draw the menu
-        
-        Args:
-            surface (pygame.Surface): Surface to draw on
-        """
-        # Background is now drawn in the main game class
-        
-        # Draw title
-        draw_text(surface, "Select Difficulty", self.font_title, WHITE, 
-                 SCREEN_WIDTH // 2, SCREEN_HEIGHT // 6, "center")
-        
-        # Draw selected mode
-        draw_text(surface, f"Mode: {self.selected_mode.capitalize()}", self.font_mode, VALORANT_BLUE, 
-                 SCREEN_WIDTH // 2, SCREEN_HEIGHT // 6 + 50, "center")
-        
-        # Draw buttons
-        for button in self.buttons:
-            button.draw(surface)
-            
-        # Draw difficulty description
-        if self.hovered_difficulty:
-            description = self.descriptions.get(self.hovered_difficulty, "")
-            draw_text(surface, description, self.font_description, WHITE, 
-                     SCREEN_WIDTH // 2, SCREEN_HEIGHT - 100, "center")
-            
-    def handle_event(self, event):
-        """
-        Handle events
-        
-        Args:
-            event (pygame.event.Event): Event to handle
-            
-        Returns:
-            str or None: The action to perform, or None
-        """
-        for button in self.buttons:
-            action = button.handle_event(event)
-            if action:
-                return action
-        return None
+        self.font_mode = get_sysfont("arial", 24)
+        mode_line = render_text(f"Mode: {selected_mode.capitalize()}",
+                                self.font_mode, VALORANT_BLUE)
+        self._static.append((mode_line, mode_line.get_rect(
+            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 6 + 50)).topleft))
 
+    @property
+    def hovered_difficulty(self):
+        """str or None: Action of the hovered difficulty button"""
+        return self.hovered_option
 
-class SettingsMenu:
+
+class SettingsMenu(ButtonMenu):
     """
     Menu for game settings
     """
     def __init__(self, settings):
         """
         Initialize the settings menu
-        
+
         Args:
             settings (dict): Current game settings
         """
-        self.font_title = pygame.font.SysFont("arial", 36, bold=True)
-        self.font_option = pygame.font.SysFont("arial", 20)
-        self.font_button = pygame.font.SysFont("arial", 20)
-        
-        self.settings = settings
-        
-        # Create buttons
         button_width = 200
         button_height = 40
         button_x = SCREEN_WIDTH // 2 - button_width // 2
         button_y_start = SCREEN_HEIGHT // 4
         button_spacing = 50
-        
-        # Toggle buttons
-        self.buttons = [
-            Button(button_x, button_y_start, button_width, button_height, 
-                  f"Sound: {'On' if settings['sound_enabled'] else 'Off'}", 
-                  self.font_button, "toggle_sound"),
-            Button(button_x, button_y_start + button_spacing, button_width, button_height, 
-                  f"Fullscreen: {'On' if settings['fullscreen'] else 'Off'}", 
-                  self.font_button, "toggle_fullscreen"),
-            Button(button_x, button_y_start + button_spacing * 2, button_width, button_height, 
-                  f"Show FPS: {'On' if settings['show_fps'] else 'Off'}", 
-                  self.font_button, "toggle_fps"),
-            Button(button_x, button_y_start + button_spacing * 3, button_width, button_height, 
-                  f"Show Stats: {'On' if settings['show_stats'] else 'Off'}", 
-                  self.font_button, "toggle_stats"),
-            Button(button_x, button_y_start + button_spacing * 4, button_width, button_height, 
-                  "Crosshair: " + settings["crosshair_style"].capitalize(), 
-                  self.font_button, "cycle_crosshair"),
-            Button(button_x, button_y_start + button_spacing * 5, button_width, button_height, 
-                  "Crosshair Color", self.font_button, "cycle_color"),
-            Button(button_x, button_y_start + button_spacing * 6, button_width, button_height, 
-                  "Save and Exit", self.font_button, "Save and Exit")
-        ]
-        
+
+        super().__init__(
+            "Settings", WHITE, (SCREEN_WIDTH // 2, SCREEN_HEIGHT // 8),
+            (
+                (f"Sound: {'On' if settings['sound_enabled'] else 'Off'}",
+                 "toggle_sound"),
+                (f"Fullscreen: {'On' if settings['fullscreen'] else 'Off'}",
+                 "toggle_fullscreen"),
+                (f"Show FPS: {'On' if settings['show_fps'] else 'Off'}",
+                 "toggle_fps"),
+                (f"Show Stats: {'On' if settings['show_stats'] else 'Off'}",
+                 "toggle_stats"),
+                ("Crosshair: " + settings["crosshair_style"].capitalize(),
+                 "cycle_crosshair"),
+                ("Crosshair Color", "cycle_color"),
+                ("Save and Exit", ACTION_SAVE_EXIT),
+            ),
+            button_y_start, button_width=button_width,
+            button_height=button_height, button_spacing=button_spacing
+        )
+
+        self.settings = settings
+
+        # Cycle options with the current index tracked up front, so a
+        # click advances an index instead of scanning for the current
+        # value
+        self._styles = ("default", "dot", "circle", "valorant")
+        self._style_idx = (self._styles.index(settings["crosshair_style"])
+                           if settings["crosshair_style"] in self._styles
+                           else 0)
+        self._colors = (
+            (255, 70, 85),    # VALORANT_RED
+            (18, 184, 253),   # VALORANT_BLUE
+            (255, 255, 255),  # WHITE
+            (0, 255, 0),      # GREEN
+            (255, 255, 0)     # YELLOW
+        )
+        current_color = tuple(settings["crosshair_color"])
+        self._color_idx = (self._colors.index(current_color)
+                           if current_color in self._colors else 0)
+
         # Color preview
         self.color_rect = pygame.Rect(button_x + button_width + 20, 
                                      button_y_start + button_spacing * 5, 
                                      30, 30)
-        
-    def update(self, mouse_pos):
-        """
-        Update the menu
-        
-        Args:
-            mouse_pos (tuple): Mouse position (x, y)
-        """
-        for button in self.buttons:
-            button.update(mouse_pos)
-            
+        # Preview surfaces per color; bounded by the cycle_color palette
+        self._color_previews = {}
+
     def draw(self, surface):
         """
         Draw the menu
-        
+
         Args:
             surface (pygame.Surface): Surface to draw on
         """
-        # Background is now drawn in the main game class
-        
-        # Draw title
-        draw_text(surface, "Settings", self.font_title, WHITE, 
-                 SCREEN_WIDTH // 2, SCREEN_HEIGHT // 8, "center")
-        
-        # Draw buttons
-        for button in self.buttons:
-            button.draw(surface)
-            
-        # Draw color preview
-        pygame.draw.rect(surface, self.settings["crosshair_color"], self.color_rect)
-        pygame.draw.rect(surface, WHITE, self.color_rect, 1)
-            
+        super().draw(surface)
+
+        # Draw the cached color preview
+        surface.blit(self._color_preview(self.settings["crosshair_color"]),
+                     self.color_rect.topleft)
+
+    def _color_preview(self, color):
+        """
+        Get the bordered swatch surface for a crosshair color
+
+        Args:
+            color (tuple): RGB color tuple
+
+        Returns:
+            pygame.Surface: The preview swatch
+        """
+        key = tuple(color)
+        preview = self._color_previews.get(key)
+        if preview is None:
+            preview = pygame.Surface(self.color_rect.size)
+            preview.fill(key)
+            pygame.draw.rect(preview, WHITE, preview.get_rect(), 1)
+            self._color_previews[key] = preview.convert()
+        return self._color_previews[key]
+
     def handle_event(self, event):
         """
         Handle events
-        
+
         Args:
             event (pygame.event.Event): Event to handle
-            
+
         Returns:
             str or None: The action to perform, or None
         """
+        # Buttons only react to left clicks; bail before touching them
+        # for anything else
+        if event.type != pygame.MOUSEBUTTONDOWN or event.button != 1:
+            return None
+        pos = event.pos
         for button in self.buttons:
-            action = button.handle_event(event)
+            action = button._check_click(pos)
             if action:
+                self.dirty = True
                 if action == "toggle_sound":
                     self.settings["sound_enabled"] = not self.settings["sound_enabled"]
-                    button.text = f"Sound: {'On' if self.settings['sound_enabled'] else 'Off'}"
+                    button.set_text(f"Sound: {'On' if self.settings['sound_enabled'] else 'Off'}")
                 elif action == "toggle_fullscreen":
                     self.settings["fullscreen"] = not self.settings["fullscreen"]
-                    button.text = f"Fullscreen: {'On' if self.settings['fullscreen'] else 'Off'}"
+                    button.set_text(f"Fullscreen: {'On' if self.settings['fullscreen'] else 'Off'}")
                 elif action == "toggle_fps":
                     self.settings["show_fps"] = not self.settings["show_fps"]
-                    button.text = f"Show FPS: {'On' if self.settings['show_fps'] else 'Off'}"
+                    button.set_text(f"Show FPS: {'On' if self.settings['show_fps'] else 'Off'}")
                 elif action == "toggle_stats":
                     self.settings["show_stats"] = not self.settings["show_stats"]
-                    button.text = f"Show Stats: {'On' if self.settings['show_stats'] else 'Off'}"
+                    button.set_text(f"Show Stats: {'On' if self.settings['show_stats'] else 'Off'}")
                 elif action == "cycle_crosshair":
-                    styles = ["default", "dot", "circle", "valorant"]
-                    current_index = styles.index(self.settings["crosshair_style"])
-                    next_index = (current_index + 1) % len(styles)
-                    self.settings["crosshair_style"] = styles[next_index]
-                    button.text = f"Crosshair: {styles[next_index].capitalize()}"
+                    self._style_idx = (self._style_idx + 1) % len(self._styles)
+                    style = self._styles[self._style_idx]
+                    self.settings["crosshair_style"] = style
+                    button.set_text(f"Crosshair: {style.capitalize()}")
                 elif action == "cycle_color":
-                    colors = [
-                        (255, 70, 85),    # VALORANT_RED
-                        (18, 184, 253),   # VALORANT_BLUE
-                        (255, 255, 255),  # WHITE
-                        (0, 255, 0),      # GREEN
-                        (255, 255, 0)     # YELLOW
-                    ]
-                    # Find the closest color in our list
-                    current_color = self.settings["crosshair_color"]
-                    current_index = 0
-                    for i, color in enumerate(colors):
-                        if color == current_color:
-                            current_index = i
-                            break
-                    next_index = (current_index + 1) % len(colors)
-                    self.settings["crosshair_color"] = colors[next_index]
-                elif action == "Save and Exit":
+                    self._color_idx = (self._color_idx + 1) % len(self._colors)
+                    self.settings["crosshair_color"] = self._colors[self._color_idx]
+                elif action == ACTION_SAVE_EXIT:
                     return action
         return None
 
@@ -486,6 +521,9 @@ class LeaderboardMenu:
     """
     Menu for displaying leaderboard
     """
+    # Column centers for the five table columns, computed once
+    _COL_X = tuple(SCREEN_WIDTH * i // 6 for i in range(1, 6))
+
     def __init__(self, scores):
         """
         Initialize the leaderboard menu
@@ -493,10 +531,10 @@ class LeaderboardMenu:
         Args:
             scores (dict): Scores data
         """
-        self.font_title = pygame.font.SysFont("arial", 36, bold=True)
-        self.font_header = pygame.font.SysFont("arial", 24)
-        self.font_score = pygame.font.SysFont("arial", 18)
-        self.font_button = pygame.font.SysFont("arial", 20)
+        self.font_title = get_sysfont("arial", 36, bold=True)
+        self.font_header = get_sysfont("arial", 24)
+        self.font_score = get_sysfont("arial", 18)
+        self.font_button = get_sysfont("arial", 20)
         
         self.scores = scores
         self.current_mode = "flick"
@@ -513,6 +551,11 @@ class LeaderboardMenu:
             self.difficulties = ["medium"]
         self.current_difficulty = self.difficulties[0] if self.difficulties else "medium"
         
+        # Static title text, rendered once
+        self._title = render_text("Leaderboard", self.font_title, WHITE)
+        self._title_pos = self._title.get_rect(
+            center=(SCREEN_WIDTH // 2, 40)).topleft
+
         # Create buttons
         button_width = 150
         button_height = 40
@@ -531,7 +574,32 @@ class LeaderboardMenu:
         # Back button
         self.back_button = Button(SCREEN_WIDTH // 2 - button_width // 2, SCREEN_HEIGHT - 100, 
                                  button_width, button_height, 
-                                 "Back", self.font_button, "Back")
+                                 "Back", self.font_button, ACTION_BACK)
+
+        # Fixed table header, composited once; drawn at y=160 so the
+        # header centers land on the original y=180 positions
+        self._header_surf = pygame.Surface((SCREEN_WIDTH, 40), pygame.SRCALPHA)
+        for text, x in zip(("Rank", "Score", "Accuracy", "Reaction", "Date"),
+                           self._COL_X):
+            header = render_text(text, self.font_header, WHITE)
+            self._header_surf.blit(header, header.get_rect(center=(x, 20)))
+
+        # Placeholder for empty tables, rendered once
+        self._no_scores = render_text("No scores yet!", self.font_header, WHITE)
+        self._no_scores_pos = self._no_scores.get_rect(
+            center=(SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2)).topleft
+
+        # Composited score rows keyed by (mode, difficulty); the scores
+        # dict is fixed for the lifetime of this menu, so entries never
+        # go stale and the cache is bounded by modes x difficulties
+        self._rows_cache = {}
+
+        self._nav_buttons = (self.mode_button, self.difficulty_button,
+                             self.back_button)
+        self._rects = _button_rects(self._nav_buttons)
+        # Redraw flag consumed by the game loop; set whenever something
+        # visible changed since the last draw
+        self.dirty = True
         
     def update(self, mouse_pos):
         """
@@ -540,9 +608,12 @@ class LeaderboardMenu:
         Args:
             mouse_pos (tuple): Mouse position (x, y)
         """
-        self.mode_button.update(mouse_pos)
-        self.difficulty_button.update(mouse_pos)
-        self.back_button.update(mouse_pos)
+        for button, hovered in zip(self._nav_buttons,
+                                   _hover_mask(self._rects, mouse_pos)):
+            hovered = bool(hovered)
+            if hovered != button.hovered:
+                button.hovered = hovered
+                self.dirty = True
             
     def draw(self, surface):
         """
@@ -553,48 +624,74 @@ class LeaderboardMenu:
         """
         # Background is now drawn in the main game class
         
-        # Draw title
-        draw_text(surface, "Leaderboard", self.font_title, WHITE, 
-                 SCREEN_WIDTH // 2, 40, "center")
+        # Draw the pre-rendered title
+        surface.blit(self._title, self._title_pos)
         
-        # Draw buttons
-        self.mode_button.draw(surface)
-        self.difficulty_button.draw(surface)
-        self.back_button.draw(surface)
+        # Draw buttons in one batched C-level call
+        surface.blits([(b._surf_hover if b.hovered else b._surf_normal,
+                        b.rect.topleft)
+                       for b in (self.mode_button, self.difficulty_button,
+                                 self.back_button)], doreturn=0)
         
         # Draw scores
         scores_list = self.get_scores()
         if scores_list:
-            # Draw headers
-            draw_text(surface, "Rank", self.font_header, WHITE, 
-                     SCREEN_WIDTH // 6, 180, "center")
-            draw_text(surface, "Score", self.font_header, WHITE, 
-                     SCREEN_WIDTH * 2 // 6, 180, "center")
-            draw_text(surface, "Accuracy", self.font_header, WHITE, 
-                     SCREEN_WIDTH * 3 // 6, 180, "center")
-            draw_text(surface, "Reaction", self.font_header, WHITE, 
-                     SCREEN_WIDTH * 4 // 6, 180, "center")
-            draw_text(surface, "Date", self.font_header, WHITE, 
-                     SCREEN_WIDTH * 5 // 6, 180, "center")
+            # Draw the pre-composited headers
+            surface.blit(self._header_surf, (0, 160))
             
-            # Draw scores
-            for i, score in enumerate(scores_list):
-                y = 220 + i * 30
-                draw_text(surface, f"#{i+1}", self.font_score, WHITE, 
-                         SCREEN_WIDTH // 6, y, "center")
-                draw_text(surface, str(score["score"]), self.font_score, WHITE, 
-                         SCREEN_WIDTH * 2 // 6, y, "center")
-                draw_text(surface, f"{score['accuracy']:.1f}%", self.font_score, WHITE, 
-                         SCREEN_WIDTH * 3 // 6, y, "center")
-                draw_text(surface, f"{score['reaction_time']:.0f}ms", self.font_score, WHITE, 
-                         SCREEN_WIDTH * 4 // 6, y, "center")
-                draw_text(surface, score["date"], self.font_score, WHITE, 
-                         SCREEN_WIDTH * 5 // 6, y, "center")
+            # Draw the composited score rows for this mode/difficulty
+            key = (self.current_mode, self.current_difficulty)
+            rows_surf = self._rows_cache.get(key)
+            if rows_surf is None:
+                rows_surf = self._build_rows_surface(scores_list)
+                self._rows_cache[key] = rows_surf
+            surface.blit(rows_surf, (0, 200))
         else:
             # No scores
-            draw_text(surface, "No scores yet!", self.font_header, WHITE, 
-                     SCREEN_WIDTH // 2, SCREEN_HEIGHT // 2, "center")
+            surface.blit(self._no_scores, self._no_scores_pos)
             
+    @staticmethod
+    def _format_rows(scores_list):
+        """
+        Format score dictionaries into display strings, one tuple per row
+
+        Runs when a rows surface is built, never per frame.
+
+        Args:
+            scores_list (list): Score dictionaries for one mode/difficulty
+
+        Returns:
+            list: (rank, score, accuracy, reaction, date) string tuples
+        """
+        return [(f"#{i+1}", str(score["score"]),
+                 f"{score['accuracy']:.1f}%",
+                 f"{score['reaction_time']:.0f}ms", score["date"])
+                for i, score in enumerate(scores_list)]
+
+    def _build_rows_surface(self, scores_list):
+        """
+        Composite every score row into one surface
+
+        Rendering the cells once per mode/difficulty switch turns the
+        per-frame cost of the table into a single blit.
+
+        Args:
+            scores_list (list): Score dictionaries for one mode/difficulty
+
+        Returns:
+            pygame.Surface: The composited rows
+        """
+        # Drawn at y=200, so local row centers land on the original
+        # 220 + i * 30 screen positions
+        rows_surf = pygame.Surface((SCREEN_WIDTH, 20 + len(scores_list) * 30),
+                                   pygame.SRCALPHA)
+        for i, cells in enumerate(self._format_rows(scores_list)):
+            y = 20 + i * 30
+            for text, x in zip(cells, self._COL_X):
+                cell = render_text(text, self.font_score, WHITE)
+                rows_surf.blit(cell, cell.get_rect(center=(x, y)))
+        return rows_surf
+
     def handle_event(self, event):
         """
         Handle events
@@ -605,35 +702,43 @@ class LeaderboardMenu:
         Returns:
             str or None: The action to perform, or None
         """
+        # Buttons only react to left clicks; bail before touching them
+        # for anything else
+        if event.type != pygame.MOUSEBUTTONDOWN or event.button != 1:
+            return None
+        pos = event.pos
+
         # Mode button
-        action = self.mode_button.handle_event(event)
+        action = self.mode_button._check_click(pos)
         if action == "cycle_mode":
             # Cycle through available modes
             if self.modes:
+                self.dirty = True
                 current_index = self.modes.index(self.current_mode)
                 next_index = (current_index + 1) % len(self.modes)
                 self.current_mode = self.modes[next_index]
-                self.mode_button.text = f"Mode: {self.current_mode.capitalize()}"
+                self.mode_button.set_text(f"Mode: {self.current_mode.capitalize()}")
                 
                 # Update difficulties for this mode
                 self.difficulties = list(self.scores.get(self.current_mode, {}).keys())
                 if not self.difficulties:
                     self.difficulties = ["medium"]
                 self.current_difficulty = self.difficulties[0] if self.difficulties else "medium"
-                self.difficulty_button.text = f"Difficulty: {self.current_difficulty.capitalize()}"
+                self.difficulty_button.set_text(f"Difficulty: {self.current_difficulty.capitalize()}")
                 
         # Difficulty button
-        action = self.difficulty_button.handle_event(event)
+        action = self.difficulty_button._check_click(pos)
         if action == "cycle_difficulty":
             # Cycle through available difficulties
             if self.difficulties:
+                self.dirty = True
                 current_index = self.difficulties.index(self.current_difficulty)
                 next_index = (current_index + 1) % len(self.difficulties)
                 self.current_difficulty = self.difficulties[next_index]
-                self.difficulty_button.text = f"Difficulty: {self.current_difficulty.capitalize()}"
+                self.difficulty_button.set_text(f"Difficulty: {self.current_difficulty.capitalize()}")
                 
         # Back button
-        action = self.back_button.handle_event(event)
+        action = self.back_button._check_click(pos)
         if action:
             return action
             